@@ -1,4 +1,6 @@
 import logging
+import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass
 from typing import Optional
 from eth_account import Account
@@ -60,8 +62,20 @@ def create_nado_client_context(
     assert opts.indexer_endpoint_url is not None, "Missing indexer endpoint URL"
 
     signer = Account.from_key(signer) if isinstance(signer, str) else signer
+    trigger_opts = (
+        TriggerClientOpts(url=opts.trigger_endpoint_url, signer=signer)
+        if opts.trigger_endpoint_url is not None
+        else None
+    )
+    # Engine, trigger and indexer requests share one connection pool. Clients leave an
+    # injected session's adapters alone, so size it here for concurrent trigger executes.
+    session = requests.Session()
+    if trigger_opts is not None:
+        adapter = HTTPAdapter(pool_maxsize=trigger_opts.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
     engine_client = EngineClient(
-        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer)
+        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer), session=session
     )
     trigger_client = None
     try:
@@ -69,10 +83,8 @@ def create_nado_client_context(
         engine_client.endpoint_addr = contracts.endpoint_addr
         engine_client.chain_id = int(contracts.chain_id)
 
-        if opts.trigger_endpoint_url is not None:
-            trigger_client = TriggerClient(
-                TriggerClientOpts(url=opts.trigger_endpoint_url, signer=signer)
-            )
+        if trigger_opts is not None:
+            trigger_client = TriggerClient(trigger_opts, session=session)
             trigger_client.endpoint_addr = contracts.endpoint_addr
             trigger_client.chain_id = int(contracts.chain_id)
     except Exception as e:
@@ -83,6 +95,8 @@ def create_nado_client_context(
         signer=signer,
         engine_client=engine_client,
         trigger_client=trigger_client,
-        indexer_client=IndexerClient(IndexerClientOpts(url=opts.indexer_endpoint_url)),
+        indexer_client=IndexerClient(
+            IndexerClientOpts(url=opts.indexer_endpoint_url), session=session
+        ),
         contracts=NadoContracts(opts.rpc_node_url, opts.contracts_context),
     )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from eth_account.signers.local import LocalAccount
 from nado_protocol.contracts.eip712.domain import (
     get_eip712_domain_type,
@@ -8,7 +9,9 @@ from nado_protocol.contracts.eip712.types import (
     EIP712Types,
     get_nado_eip712_type,
 )
-from eth_account.messages import encode_structured_data, _hash_eip191_message
+from eth_abi import encode
+from eth_account.messages import SignableMessage, _hash_eip191_message
+from eth_utils import keccak
 
 from nado_protocol.contracts.types import NadoTxType
 
@@ -48,6 +51,73 @@ def build_eip712_typed_data(
     )
 
 
+EIP712Fields = tuple[tuple[str, str], ...]
+
+
+@lru_cache(maxsize=64)
+def _hash_eip712_struct_type(primary_type: str, fields: EIP712Fields) -> bytes:
+    return keccak(
+        text=f"{primary_type}({','.join(f'{type} {name}' for name, type in fields)})"
+    )
+
+
+def _hash_eip712_struct(primary_type: str, fields: EIP712Fields, data: dict) -> bytes:
+    """
+    EIP-712 `hashStruct` for a struct whose fields are atomic types, strings, bytes or
+    one-dimensional arrays of atomic types, which covers the domain and every Nado tx.
+    """
+    encoded_types = ["bytes32"]
+    encoded_values = [_hash_eip712_struct_type(primary_type, fields)]
+    for name, type in fields:
+        value = data[name]
+        if value is None:
+            raise ValueError(f"Missing value for field {name} of type {type}")
+        if type == "string":
+            encoded_types.append("bytes32")
+            encoded_values.append(keccak(text=value))
+        elif type == "bytes":
+            encoded_types.append("bytes32")
+            encoded_values.append(keccak(value))
+        elif type.endswith("[]"):
+            item_type = type[:-2]
+            encoded_types.append("bytes32")
+            encoded_values.append(keccak(encode([item_type] * len(value), value)))
+        else:
+            encoded_types.append(type)
+            encoded_values.append(value)
+    return keccak(encode(encoded_types, encoded_values))
+
+
+@lru_cache(maxsize=64)
+def _hash_eip712_domain(domain_fields: EIP712Fields, domain_values: tuple) -> bytes:
+    # The domain separator only depends on the (verifying contract, chain) domain, yet
+    # accounts for a third of every digest, so it is hashed once per distinct domain.
+    return _hash_eip712_struct(
+        "EIP712Domain", domain_fields, dict(zip(dict(domain_fields), domain_values))
+    )
+
+
+def _encode_eip712_typed_data(typed_data: EIP712TypedData) -> SignableMessage:
+    """
+    Equivalent of `eth_account.messages.encode_structured_data` that reuses the cached domain separator.
+    """
+    structured_data = typed_data.dict()
+    types = structured_data["types"]
+    domain_fields = tuple(
+        (field["name"], field["type"]) for field in types["EIP712Domain"]
+    )
+    domain_values = tuple(structured_data["domain"][name] for name, _ in domain_fields)
+    primary_type = structured_data["primaryType"]
+    message_fields = tuple(
+        (field["name"], field["type"]) for field in types[primary_type]
+    )
+    return SignableMessage(
+        b"\x01",
+        _hash_eip712_domain(domain_fields, domain_values),
+        _hash_eip712_struct(primary_type, message_fields, structured_data["message"]),
+    )
+
+
 def get_eip712_typed_data_digest(typed_data: EIP712TypedData) -> str:
     """
     Util to get the EIP-712 typed data hash.
@@ -58,7 +128,7 @@ def get_eip712_typed_data_digest(typed_data: EIP712TypedData) -> str:
     Returns:
         str: The hexadecimal representation of the hash.
     """
-    encoded_data = encode_structured_data(typed_data.dict())
+    encoded_data = _encode_eip712_typed_data(typed_data)
     return f"0x{_hash_eip191_message(encoded_data).hex()}"
 
 
@@ -74,6 +144,6 @@ def sign_eip712_typed_data(typed_data: EIP712TypedData, signer: LocalAccount) ->
     Returns:
         str: The hexadecimal representation of the signature.
     """
-    encoded_data = encode_structured_data(typed_data.dict())
+    encoded_data = _encode_eip712_typed_data(typed_data)
     typed_data_hash = signer.sign_message(encoded_data)
     return typed_data_hash.signature.hex()
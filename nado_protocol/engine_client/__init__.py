@@ -1,3 +1,5 @@
+from typing import Optional
+import requests
 from nado_protocol.engine_client.types import EngineClientOpts
 from nado_protocol.engine_client.execute import EngineExecuteClient
 from nado_protocol.engine_client.query import EngineQueryClient
@@ -16,15 +18,21 @@ class EngineClient(EngineQueryClient, EngineExecuteClient):  # type: ignore
         __init__: Initializes the `EngineClient` with the provided options.
     """
 
-    def __init__(self, opts: EngineClientOpts):
+    def __init__(
+        self, opts: EngineClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initializes the EngineClient with the provided options.
 
         Args:
             opts (EngineClientOpts): Client configuration options for connecting and interacting with the engine service.
+
+            session (requests.Session, optional): HTTP session shared by queries and executes, e.g. one also passed to
+                an `IndexerClient` to reuse pooled connections. If not provided, a new one is created.
         """
-        EngineQueryClient.__init__(self, opts)
-        EngineExecuteClient.__init__(self, opts)
+        session = session or requests.Session()
+        EngineQueryClient.__init__(self, opts, session=session)
+        EngineExecuteClient.__init__(self, opts, querier=self, session=session)
 
 
 __all__ = [
@@ -45,7 +45,10 @@ class EngineExecuteClient(NadoBaseExecute):
     """
 
     def __init__(
-        self, opts: EngineClientOpts, querier: Optional[EngineQueryClient] = None
+        self,
+        opts: EngineClientOpts,
+        querier: Optional[EngineQueryClient] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the EngineExecuteClient with provided options.
@@ -54,13 +57,16 @@ class EngineExecuteClient(NadoBaseExecute):
             opts (EngineClientOpts): Options for the client.
 
             querier (EngineQueryClient, optional): An EngineQueryClient instance. If not provided, a new one is created.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with other clients
+                to reuse pooled connections. If not provided, a new one is created.
         """
         super().__init__(opts)
-        self._querier = querier or EngineQueryClient(opts)
+        self.session = session or requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        self._querier = querier or EngineQueryClient(opts, session=self.session)
         self._opts: EngineClientOpts = EngineClientOpts.parse_obj(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()
-        self.session.headers.update({"Accept-Encoding": "gzip"})
 
     def tx_nonce(self, sender: str) -> int:
         """
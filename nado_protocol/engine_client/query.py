@@ -66,17 +66,22 @@ class EngineQueryClient:
     Client class for querying the off-chain engine.
     """
 
-    def __init__(self, opts: EngineClientOpts):
+    def __init__(
+        self, opts: EngineClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initialize EngineQueryClient with provided options.
 
         Args:
             opts (EngineClientOpts): Options for the client.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with other clients
+                to reuse pooled connections. If not provided, a new one is created.
         """
         self._opts: EngineClientOpts = EngineClientOpts.parse_obj(opts)
         self.url: str = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()  # type: ignore
+        self.session = session or requests.Session()  # type: ignore
         self.session.headers.update({"Accept-Encoding": "gzip"})
 
     def query(self, req: QueryRequest) -> QueryResponse:
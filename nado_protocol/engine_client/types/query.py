@@ -1,6 +1,6 @@
 from nado_protocol.utils.enum import StrEnum
 from typing import Optional, Union
-from pydantic import validator
+from pydantic import PrivateAttr, validator
 from nado_protocol.utils.model import NadoBaseModel
 from nado_protocol.engine_client.types.models import (
     ApplyDeltaTx,
@@ -408,6 +408,27 @@ class AllProductsData(NadoBaseModel):
     spot_products: list[SpotProduct]
     perp_products: list[PerpProduct]
 
+    _spot_by_id: Optional[dict[int, SpotProduct]] = PrivateAttr(default=None)
+    _perp_by_id: Optional[dict[int, PerpProduct]] = PrivateAttr(default=None)
+
+    @property
+    def spot_by_id(self) -> dict[int, SpotProduct]:
+        """
+        Spot products keyed by product id, built on first access.
+        """
+        if self._spot_by_id is None:
+            self._spot_by_id = {p.product_id: p for p in self.spot_products}
+        return self._spot_by_id
+
+    @property
+    def perp_by_id(self) -> dict[int, PerpProduct]:
+        """
+        Perp products keyed by product id, built on first access.
+        """
+        if self._perp_by_id is None:
+            self._perp_by_id = {p.product_id: p for p in self.perp_products}
+        return self._perp_by_id
+
 
 class MarketPriceData(NadoBaseModel):
     """
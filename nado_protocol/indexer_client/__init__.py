@@ -1,3 +1,5 @@
+from typing import Optional
+import requests
 from nado_protocol.indexer_client.query import IndexerQueryClient
 from nado_protocol.indexer_client.types import IndexerClientOpts
 
@@ -15,14 +17,19 @@ class IndexerClient(IndexerQueryClient):
         __init__: Initializes the `IndexerClient` with the provided options.
     """
 
-    def __init__(self, opts: IndexerClientOpts):
+    def __init__(
+        self, opts: IndexerClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initializes the IndexerClient with the provided options.
 
         Args:
             opts (IndexerClientOpts): Client configuration options for connecting and interacting with the indexer service.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with an
+                `EngineClient` to reuse pooled connections. If not provided, a new one is created.
         """
-        super().__init__(opts)
+        super().__init__(opts, session=session)
 
 
 __all__ = ["IndexerClient", "IndexerClientOpts", "IndexerQueryClient"]
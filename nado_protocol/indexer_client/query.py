@@ -61,17 +61,22 @@ class IndexerQueryClient:
         url (str): URL of the indexer service.
     """
 
-    def __init__(self, opts: IndexerClientOpts):
+    def __init__(
+        self, opts: IndexerClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initializes the IndexerQueryClient with the provided options.
 
         Args:
             opts (IndexerClientOpts): Client configuration options for connecting and interacting with the indexer service.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with other clients
+                to reuse pooled connections. If not provided, a new one is created.
         """
         self._opts = IndexerClientOpts.parse_obj(opts)
         self.url = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         self.session.headers.update({"Accept-Encoding": "gzip"})
 
     @singledispatchmethod
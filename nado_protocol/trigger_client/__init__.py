@@ -1,15 +1,31 @@
+from typing import Optional
+import requests
 from nado_protocol.trigger_client.types import TriggerClientOpts
 from nado_protocol.trigger_client.execute import TriggerExecuteClient
 from nado_protocol.trigger_client.query import TriggerQueryClient
+from nado_protocol.trigger_client.async_execute import AsyncTriggerExecuteClient
 
 
 class TriggerClient(TriggerQueryClient, TriggerExecuteClient):  # type: ignore
-    def __init__(self, opts: TriggerClientOpts):
-        TriggerQueryClient.__init__(self, opts)
-        TriggerExecuteClient.__init__(self, opts)
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
+        """
+        Initializes the TriggerClient with the provided options.
+
+        Args:
+            opts (TriggerClientOpts): Client configuration options for connecting and interacting with the trigger service.
+
+            session (requests.Session, optional): HTTP session shared by queries and executes, e.g. one also passed to
+                an `EngineClient` to reuse pooled connections. If not provided, the execute client creates one with
+                its connection pool and queries share it.
+        """
+        TriggerExecuteClient.__init__(self, opts, session=session)
+        TriggerQueryClient.__init__(self, opts, session=self.session)
 
 
 __all__ = [
+    "AsyncTriggerExecuteClient",
     "TriggerClient",
     "TriggerClientOpts",
     "TriggerExecuteClient",
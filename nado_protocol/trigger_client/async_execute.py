@@ -0,0 +1,152 @@
+import asyncio
+from typing import List, Optional, Union
+from nado_protocol.engine_client.types.execute import ExecuteResponse
+from nado_protocol.trigger_client.execute import TriggerExecuteClient
+from nado_protocol.trigger_client.types.execute import (
+    TriggerExecuteParams,
+    TriggerExecuteRequest,
+    PlaceTriggerOrderParams,
+    PlaceTriggerOrdersParams,
+    CancelTriggerOrdersParams,
+    CancelProductTriggerOrdersParams,
+)
+from nado_protocol.trigger_client.types.models import Dependency
+from nado_protocol.utils.expiration import OrderType
+from nado_protocol.utils.subaccount import SubaccountParams
+
+
+class AsyncTriggerExecuteClient(TriggerExecuteClient):
+    """
+    Trigger execute client exposing awaitable variants of the execute operations.
+
+    Each coroutine runs its synchronous counterpart in a worker thread and shares the client's
+    pooled HTTP session, so many orders can be submitted concurrently, e.g:
+
+        await asyncio.gather(*[client.aplace_trigger_order(p) for p in batch])
+    """
+
+    async def aexecute(
+        self, params: Union[TriggerExecuteParams, TriggerExecuteRequest, dict]
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `execute`.
+
+        Args:
+            params (TriggerExecuteParams | TriggerExecuteRequest | dict): The operation to execute.
+
+        Returns:
+            ExecuteResponse: The response from the executed operation.
+        """
+        return await asyncio.to_thread(self.execute, params)
+
+    async def aplace_trigger_order(
+        self, params: PlaceTriggerOrderParams
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `place_trigger_order`.
+        """
+        return await asyncio.to_thread(self.place_trigger_order, params)
+
+    async def aplace_trigger_orders(
+        self, params: PlaceTriggerOrdersParams
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `place_trigger_orders`.
+        """
+        return await asyncio.to_thread(self.place_trigger_orders, params)
+
+    async def aplace_twap_order(
+        self,
+        product_id: int,
+        price_x18: Union[int, str],
+        total_amount_x18: Union[int, str],
+        times: int,
+        slippage_frac: float,
+        interval_seconds: int,
+        sender: Optional[Union[str, SubaccountParams]] = None,
+        subaccount_owner: Optional[str] = None,
+        subaccount_name: str = "default",
+        expiration: Optional[int] = None,
+        nonce: Optional[int] = None,
+        custom_amounts_x18: Optional[List[str]] = None,
+        reduce_only: bool = False,
+        spot_leverage: Optional[bool] = None,
+        id: Optional[int] = None,
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `place_twap_order`.
+        """
+        return await asyncio.to_thread(
+            self.place_twap_order,
+            product_id=product_id,
+            price_x18=price_x18,
+            total_amount_x18=total_amount_x18,
+            times=times,
+            slippage_frac=slippage_frac,
+            interval_seconds=interval_seconds,
+            sender=sender,
+            subaccount_owner=subaccount_owner,
+            subaccount_name=subaccount_name,
+            expiration=expiration,
+            nonce=nonce,
+            custom_amounts_x18=custom_amounts_x18,
+            reduce_only=reduce_only,
+            spot_leverage=spot_leverage,
+            id=id,
+        )
+
+    async def aplace_price_trigger_order(
+        self,
+        product_id: int,
+        price_x18: Union[int, str],
+        amount_x18: Union[int, str],
+        trigger_price_x18: Union[int, str],
+        trigger_type: str,
+        sender: Optional[Union[str, SubaccountParams]] = None,
+        subaccount_owner: Optional[str] = None,
+        subaccount_name: str = "default",
+        expiration: Optional[int] = None,
+        nonce: Optional[int] = None,
+        reduce_only: bool = False,
+        order_type: OrderType = OrderType.DEFAULT,
+        spot_leverage: Optional[bool] = None,
+        id: Optional[int] = None,
+        dependency: Optional[Dependency] = None,
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `place_price_trigger_order`.
+        """
+        return await asyncio.to_thread(
+            self.place_price_trigger_order,
+            product_id=product_id,
+            price_x18=price_x18,
+            amount_x18=amount_x18,
+            trigger_price_x18=trigger_price_x18,
+            trigger_type=trigger_type,
+            sender=sender,
+            subaccount_owner=subaccount_owner,
+            subaccount_name=subaccount_name,
+            expiration=expiration,
+            nonce=nonce,
+            reduce_only=reduce_only,
+            order_type=order_type,
+            spot_leverage=spot_leverage,
+            id=id,
+            dependency=dependency,
+        )
+
+    async def acancel_trigger_orders(
+        self, params: CancelTriggerOrdersParams
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `cancel_trigger_orders`.
+        """
+        return await asyncio.to_thread(self.cancel_trigger_orders, params)
+
+    async def acancel_product_trigger_orders(
+        self, params: CancelProductTriggerOrdersParams
+    ) -> ExecuteResponse:
+        """
+        Awaitable version of `cancel_product_trigger_orders`.
+        """
+        return await asyncio.to_thread(self.cancel_product_trigger_orders, params)
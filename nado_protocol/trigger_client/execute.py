@@ -1,23 +1,27 @@
 import requests
-from functools import singledispatchmethod
-from typing import Union, Optional, List, cast
+from pydantic import parse_obj_as
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Sequence, Union, Optional, List, cast
 from nado_protocol.contracts.types import NadoExecuteType
 from nado_protocol.trigger_client.types.execute import (
     TriggerExecuteParams,
     TriggerExecuteRequest,
     PlaceTriggerOrderParams,
+    PlaceTriggerOrdersParams,
     CancelTriggerOrdersParams,
     CancelProductTriggerOrdersParams,
     to_trigger_execute_request,
 )
 from nado_protocol.engine_client.types.execute import ExecuteResponse
+from nado_protocol.engine_client.types.models import ResponseStatus
 from nado_protocol.trigger_client.types import TriggerClientOpts
 from nado_protocol.utils.exceptions import (
     BadStatusCodeException,
     ExecuteFailedException,
 )
 from nado_protocol.utils.execute import NadoBaseExecute, OrderParams
-from nado_protocol.utils.model import NadoBaseModel, is_instance_of_union
+from nado_protocol.utils.model import is_instance_of_union
 from nado_protocol.utils.twap import create_twap_order
 from nado_protocol.utils.order import build_appendix, OrderAppendixTriggerType
 from nado_protocol.utils.expiration import OrderType, get_expiration_timestamp
@@ -37,56 +41,109 @@ from nado_protocol.trigger_client.types.models import (
     Dependency,
 )
 
+# Builds the price requirement for each supported `trigger_type` from its trigger price.
+# Fields are set from already-typed inputs, so the models skip re-validation.
+_PRICE_REQUIREMENT_BUILDERS: Dict[str, Callable[[str], PriceRequirement]] = {
+    "last_price_above": lambda price: LastPriceAbove.construct(last_price_above=price),
+    "last_price_below": lambda price: LastPriceBelow.construct(last_price_below=price),
+    "oracle_price_above": lambda price: OraclePriceAbove.construct(
+        oracle_price_above=price
+    ),
+    "oracle_price_below": lambda price: OraclePriceBelow.construct(
+        oracle_price_below=price
+    ),
+    "mid_price_above": lambda price: MidPriceAbove.construct(mid_price_above=price),
+    "mid_price_below": lambda price: MidPriceBelow.construct(mid_price_below=price),
+}
+
 
 class TriggerExecuteClient(NadoBaseExecute):
-    def __init__(self, opts: TriggerClientOpts):
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize TriggerExecuteClient with provided options.
+
+        Args:
+            opts (TriggerClientOpts): Options for the client.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with other clients
+                to reuse pooled connections. If not provided, a new one is created with a connection pool sized by
+                `pool_maxsize`. A provided session is used as-is, keeping any adapters already mounted on it.
+        """
         super().__init__(opts)
-        self._opts: TriggerClientOpts = TriggerClientOpts.parse_obj(opts)
+        self._opts: TriggerClientOpts = (
+            opts
+            if isinstance(opts, TriggerClientOpts)
+            else TriggerClientOpts.parse_obj(opts)
+        )
         self.url: str = self._opts.url
-        self.session = requests.Session()
+        self._execute_url: str = f"{self.url}/execute"
+        if session is None:
+            session = requests.Session()
+            # Keep a warm pool of connections so repeated executes skip the TCP/TLS handshake.
+            adapter = HTTPAdapter(pool_maxsize=self._opts.pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
         self.session.headers.update({"Accept-Encoding": "gzip"})
 
     def tx_nonce(self, _: str) -> int:
         raise NotImplementedError
 
-    @singledispatchmethod
     def execute(
-        self, params: Union[TriggerExecuteParams, TriggerExecuteRequest]
+        self, params: Union[TriggerExecuteParams, TriggerExecuteRequest, dict]
     ) -> ExecuteResponse:
         """
         Executes the operation defined by the provided parameters.
 
         Args:
-            params (ExecuteParams): The parameters for the operation to execute. This can represent a variety of operations, such as placing orders, cancelling orders, and more.
+            params (TriggerExecuteParams | TriggerExecuteRequest | dict): The parameters for the operation to execute. This can represent a variety of operations, such as placing orders, cancelling orders, and more. Dicts are parsed as a `TriggerExecuteRequest` unless `trust_input` is enabled, in which case they are sent as-is.
 
         Returns:
             ExecuteResponse: The response from the executed operation.
         """
+        if isinstance(params, dict):
+            if self._opts.trust_input:
+                return self._execute(params)
+            return self._execute(parse_obj_as(TriggerExecuteRequest, params))  # type: ignore
         req: TriggerExecuteRequest = (
             params if is_instance_of_union(params, TriggerExecuteRequest) else to_trigger_execute_request(params)  # type: ignore
         )
         return self._execute(req)
 
-    @execute.register
-    def _(self, req: dict) -> ExecuteResponse:
+    def execute_many(
+        self,
+        reqs: Sequence[Union[TriggerExecuteParams, TriggerExecuteRequest, dict]],
+    ) -> List[Union[ExecuteResponse, Exception]]:
         """
-        Overloaded method to execute the operation defined by the provided request.
+        Executes multiple operations concurrently over the client's pooled keep-alive connections.
 
         Args:
-            req (dict): The request data for the operation to execute. Can be a dictionary or an instance of ExecuteRequest.
+            reqs (Sequence[TriggerExecuteParams | TriggerExecuteRequest | dict]): The operations to execute, each accepted by `execute`.
 
         Returns:
-            ExecuteResponse: The response from the executed operation.
+            List[ExecuteResponse | Exception]: The result of each operation in submission order. Failed operations
+            return their exception instead of aborting the remaining ones.
         """
-        parsed_req: TriggerExecuteRequest = NadoBaseModel.parse_obj(req)  # type: ignore
-        return self._execute(parsed_req)
-
-    def _execute(self, req: TriggerExecuteRequest) -> ExecuteResponse:
+        if not reqs:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(reqs), self._opts.pool_maxsize)
+        ) as executor:
+            futures = [executor.submit(self.execute, req) for req in reqs]
+        results: List[Union[ExecuteResponse, Exception]] = []
+        for future in futures:
+            exc = future.exception()
+            results.append(exc if isinstance(exc, Exception) else future.result())
+        return results
+
+    def _execute(self, req: Union[TriggerExecuteRequest, dict]) -> ExecuteResponse:
         """
         Internal method to execute the operation. Sends request to the server.
 
         Args:
-            req (TriggerExecuteRequest): The request data for the operation to execute.
+            req (TriggerExecuteRequest | dict): The request data for the operation to execute. Dicts are sent as-is.
 
         Returns:
             ExecuteResponse: The response from the executed operation.
@@ -94,12 +151,27 @@ class TriggerExecuteClient(NadoBaseExecute):
         Raises:
             BadStatusCodeException: If the server response status code is not 200.
             ExecuteFailedException: If there's an error in the execution or the response status is not "success".
+
+        Note:
+            When `lightweight` is enabled, successful responses skip building the response model, so only
+            `status`, `signature` and `req` are populated and `data` is left unset.
         """
-        res = self.session.post(f"{self.url}/execute", json=req.dict())
+        req_dict = req if isinstance(req, dict) else req.dict()
+        res = self.session.post(self._execute_url, json=req_dict)
         if res.status_code != 200:
             raise BadStatusCodeException(res.text)
         try:
-            execute_res = ExecuteResponse(**res.json(), req=req.dict())
+            res_json = res.json()
+            if (
+                self._opts.lightweight
+                and res_json.get("status") == ResponseStatus.SUCCESS
+            ):
+                return ExecuteResponse.construct(
+                    status=ResponseStatus.SUCCESS,
+                    signature=res_json.get("signature"),
+                    req=req_dict,
+                )
+            execute_res = ExecuteResponse(**res_json, req=req_dict)
         except Exception:
             raise ExecuteFailedException(res.text)
         if execute_res.status != "success":
@@ -107,18 +179,54 @@ class TriggerExecuteClient(NadoBaseExecute):
         return execute_res
 
     def place_trigger_order(self, params: PlaceTriggerOrderParams) -> ExecuteResponse:
-        params = PlaceTriggerOrderParams.parse_obj(params)
+        # Already-validated params only need a shallow copy to avoid mutating the caller's object.
+        params = (
+            params.copy()
+            if isinstance(params, PlaceTriggerOrderParams)
+            else PlaceTriggerOrderParams.parse_obj(params)
+        )
         params.order = self.prepare_execute_params(params.order, True)
         params.signature = params.signature or self._sign(
             NadoExecuteType.PLACE_ORDER, params.order.dict(), params.product_id
         )
         return self.execute(params)
 
+    def place_trigger_orders(self, params: PlaceTriggerOrdersParams) -> ExecuteResponse:
+        """
+        Places multiple trigger orders in a single request.
+
+        Each order is signed individually, exactly as in `place_trigger_order`, and all of them are
+        sent in one `place_orders` execute so the batch pays for a single HTTP round-trip.
+
+        Args:
+            params (PlaceTriggerOrdersParams): The trigger orders to place.
+
+        Returns:
+            ExecuteResponse: The response from placing the orders, with a digest or error per order.
+        """
+        params = (
+            params.copy()
+            if isinstance(params, PlaceTriggerOrdersParams)
+            else PlaceTriggerOrdersParams.parse_obj(params)
+        )
+        orders = []
+        for order_params in params.orders:
+            order_params = order_params.copy()
+            order_params.order = self.prepare_execute_params(order_params.order, True)
+            order_params.signature = order_params.signature or self._sign(
+                NadoExecuteType.PLACE_ORDER,
+                order_params.order.dict(),
+                order_params.product_id,
+            )
+            orders.append(order_params)
+        params.orders = orders
+        return self.execute(params)
+
     def place_twap_order(
         self,
         product_id: int,
-        price_x18: str,
-        total_amount_x18: str,
+        price_x18: Union[int, str],
+        total_amount_x18: Union[int, str],
         times: int,
         slippage_frac: float,
         interval_seconds: int,
@@ -139,8 +247,8 @@ class TriggerExecuteClient(NadoBaseExecute):
 
         Args:
             product_id (int): The product ID for the order.
-            price_x18 (str): The limit price multiplied by 1e18.
-            total_amount_x18 (str): The total amount to trade multiplied by 1e18 (signed, negative for sell).
+            price_x18 (Union[int, str]): The limit price multiplied by 1e18.
+            total_amount_x18 (Union[int, str]): The total amount to trade multiplied by 1e18 (signed, negative for sell).
             times (int): Number of TWAP executions (1-500).
             slippage_frac (float): Slippage tolerance as a fraction (e.g., 0.01 for 1%).
             interval_seconds (int): Time interval between executions in seconds.
@@ -204,9 +312,9 @@ class TriggerExecuteClient(NadoBaseExecute):
     def place_price_trigger_order(
         self,
         product_id: int,
-        price_x18: str,
-        amount_x18: str,
-        trigger_price_x18: str,
+        price_x18: Union[int, str],
+        amount_x18: Union[int, str],
+        trigger_price_x18: Union[int, str],
         trigger_type: str,
         sender: Optional[Union[str, SubaccountParams]] = None,
         subaccount_owner: Optional[str] = None,
@@ -226,9 +334,9 @@ class TriggerExecuteClient(NadoBaseExecute):
 
         Args:
             product_id (int): The product ID for the order.
-            price_x18 (str): The limit price multiplied by 1e18.
-            amount_x18 (str): The amount to trade multiplied by 1e18 (signed, negative for sell).
-            trigger_price_x18 (str): The trigger price multiplied by 1e18.
+            price_x18 (Union[int, str]): The limit price multiplied by 1e18.
+            amount_x18 (Union[int, str]): The amount to trade multiplied by 1e18 (signed, negative for sell).
+            trigger_price_x18 (Union[int, str]): The trigger price multiplied by 1e18.
             trigger_type (str): Type of price trigger - one of:
                 "last_price_above", "last_price_below",
                 "oracle_price_above", "oracle_price_below",
@@ -254,27 +362,20 @@ class TriggerExecuteClient(NadoBaseExecute):
             ValueError: If trigger_type is not supported.
         """
         # Create the appropriate price requirement based on trigger type
-        price_requirement: PriceRequirement
-        if trigger_type == "last_price_above":
-            price_requirement = LastPriceAbove(last_price_above=trigger_price_x18)
-        elif trigger_type == "last_price_below":
-            price_requirement = LastPriceBelow(last_price_below=trigger_price_x18)
-        elif trigger_type == "oracle_price_above":
-            price_requirement = OraclePriceAbove(oracle_price_above=trigger_price_x18)
-        elif trigger_type == "oracle_price_below":
-            price_requirement = OraclePriceBelow(oracle_price_below=trigger_price_x18)
-        elif trigger_type == "mid_price_above":
-            price_requirement = MidPriceAbove(mid_price_above=trigger_price_x18)
-        elif trigger_type == "mid_price_below":
-            price_requirement = MidPriceBelow(mid_price_below=trigger_price_x18)
-        else:
+        build_requirement = _PRICE_REQUIREMENT_BUILDERS.get(trigger_type)
+        if build_requirement is None:
             raise ValueError(
                 f"Unsupported trigger_type: {trigger_type}. "
-                f"Supported types: ['last_price_above', 'last_price_below', 'oracle_price_above', 'oracle_price_below', 'mid_price_above', 'mid_price_below']"
+                f"Supported types: {list(_PRICE_REQUIREMENT_BUILDERS)}"
             )
 
-        trigger = PriceTrigger(
-            price_trigger=PriceTriggerData(
+        price_requirement = build_requirement(str(trigger_price_x18))
+        # Only the requirement above is built internally; the caller's dependency still
+        # needs validating before it goes into the unvalidated trigger.
+        if dependency is not None and not isinstance(dependency, Dependency):
+            dependency = Dependency.parse_obj(dependency)
+        trigger = PriceTrigger.construct(
+            price_trigger=PriceTriggerData.construct(
                 price_requirement=price_requirement, dependency=dependency
             )
         )
@@ -309,7 +410,8 @@ class TriggerExecuteClient(NadoBaseExecute):
             appendix=appendix,
         )
 
-        params = PlaceTriggerOrderParams(
+        # The order was validated above and the trigger is already typed, so skip re-validation.
+        params = PlaceTriggerOrderParams.construct(
             product_id=product_id,
             order=order_params,
             trigger=trigger,
@@ -324,9 +426,9 @@ class TriggerExecuteClient(NadoBaseExecute):
     def cancel_trigger_orders(
         self, params: CancelTriggerOrdersParams
     ) -> ExecuteResponse:
-        params = self.prepare_execute_params(
-            CancelTriggerOrdersParams.parse_obj(params), True
-        )
+        if not isinstance(params, CancelTriggerOrdersParams):
+            params = CancelTriggerOrdersParams.parse_obj(params)
+        params = self.prepare_execute_params(params, True)
         params.signature = params.signature or self._sign(
             NadoExecuteType.CANCEL_ORDERS, params.dict()
         )
@@ -335,9 +437,9 @@ class TriggerExecuteClient(NadoBaseExecute):
     def cancel_product_trigger_orders(
         self, params: CancelProductTriggerOrdersParams
     ) -> ExecuteResponse:
-        params = self.prepare_execute_params(
-            CancelProductTriggerOrdersParams.parse_obj(params), True
-        )
+        if not isinstance(params, CancelProductTriggerOrdersParams):
+            params = CancelProductTriggerOrdersParams.parse_obj(params)
+        params = self.prepare_execute_params(params, True)
         params.signature = params.signature or self._sign(
             NadoExecuteType.CANCEL_PRODUCT_ORDERS, params.dict()
         )
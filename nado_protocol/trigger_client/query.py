@@ -1,3 +1,4 @@
+from typing import Optional
 import requests
 from nado_protocol.contracts.types import NadoTxType
 from nado_protocol.trigger_client.types import TriggerClientOpts
@@ -22,10 +23,25 @@ class TriggerQueryClient(NadoBaseExecute):
     Client class for querying the trigger service.
     """
 
-    def __init__(self, opts: TriggerClientOpts):
-        self._opts: TriggerClientOpts = TriggerClientOpts.parse_obj(opts)
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize TriggerQueryClient with provided options.
+
+        Args:
+            opts (TriggerClientOpts): Options for the client.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared with other clients
+                to reuse pooled connections. If not provided, a new one is created.
+        """
+        self._opts: TriggerClientOpts = (
+            opts
+            if isinstance(opts, TriggerClientOpts)
+            else TriggerClientOpts.parse_obj(opts)
+        )
         self.url: str = self._opts.url
-        self.session = requests.Session()  # type: ignore
+        self.session = session or requests.Session()  # type: ignore
         self.session.headers.update({"Accept-Encoding": "gzip"})
 
     def tx_nonce(self, _: str) -> int:
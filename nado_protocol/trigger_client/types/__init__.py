@@ -4,4 +4,13 @@ from nado_protocol.utils.backend import NadoClientOpts
 class TriggerClientOpts(NadoClientOpts):
     """
     Model defining the configuration options for the Trigger Client.
+
+    Attributes:
+        pool_maxsize (int): Maximum number of keep-alive connections held in the HTTP connection pool.
+        trust_input (bool): When True, request dicts passed to `execute` are sent as-is, skipping validation. Defaults to False.
+        lightweight (bool): When True, successful execute responses are returned without building the response model. Only `status`, `signature` and `req` are set; `data` is left as None, so read results such as order digests from the request instead. Defaults to False.
     """
+
+    pool_maxsize: int = 32
+    trust_input: bool = False
+    lightweight: bool = False
@@ -26,12 +26,14 @@ __all__ = [
     "OrderType",
     "get_expiration_timestamp",
     "gen_order_nonce",
+    "gen_order_nonces",
     "to_pow_10",
     "to_x6",
     "to_x18",
     "from_pow_10",
     "from_x6",
     "from_x18",
+    "from_x18_decimal",
     "ExecuteFailedException",
     "QueryFailedException",
     "BadStatusCodeException",
@@ -10,7 +10,7 @@ from nado_protocol.engine_client.types.models import (
     SpotProductBalance,
     PerpProductBalance,
 )
-from nado_protocol.utils.math import from_x18
+from nado_protocol.utils.math import from_x18_decimal
 
 
 def calculate_spot_balance_value(
@@ -125,8 +125,8 @@ def parse_spot_balance_value(
     Returns:
         Balance value in quote currency
     """
-    amount = Decimal(from_x18(int(balance.balance.amount)))
-    oracle_price = Decimal(from_x18(int(product.oracle_price_x18)))
+    amount = from_x18_decimal(balance.balance.amount)
+    oracle_price = from_x18_decimal(product.oracle_price_x18)
     return calculate_spot_balance_value(amount, oracle_price)
 
 
@@ -143,8 +143,8 @@ def parse_perp_balance_notional_value(
     Returns:
         Notional value in quote currency
     """
-    amount = Decimal(from_x18(int(balance.balance.amount)))
-    oracle_price = Decimal(from_x18(int(product.oracle_price_x18)))
+    amount = from_x18_decimal(balance.balance.amount)
+    oracle_price = from_x18_decimal(product.oracle_price_x18)
     return calculate_perp_balance_notional_value(amount, oracle_price)
 
 
@@ -161,9 +161,9 @@ def parse_perp_balance_value(
     Returns:
         Balance value in quote currency
     """
-    amount = Decimal(from_x18(int(balance.balance.amount)))
-    oracle_price = Decimal(from_x18(int(product.oracle_price_x18)))
-    v_quote = Decimal(from_x18(int(balance.balance.v_quote_balance)))
+    amount = from_x18_decimal(balance.balance.amount)
+    oracle_price = from_x18_decimal(product.oracle_price_x18)
+    v_quote = from_x18_decimal(balance.balance.v_quote_balance)
     return calculate_perp_balance_value(amount, oracle_price, v_quote)
 
 
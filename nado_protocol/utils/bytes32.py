@@ -1,4 +1,5 @@
 import binascii
+from functools import lru_cache
 from typing import Optional, Union
 from nado_protocol.utils.subaccount import Subaccount, SubaccountParams
 
@@ -86,18 +87,25 @@ def subaccount_to_bytes32(
             return hex_to_bytes32(subaccount)
         else:
             name = name.hex() if isinstance(name, bytes) else name
-            return hex_to_bytes32(subaccount + str_to_hex(name))
+            return _owner_and_name_to_bytes32(subaccount, name)
     elif isinstance(subaccount, SubaccountParams):
-        subaccount_owner = subaccount.dict().get("subaccount_owner")
-        subaccount_name = subaccount.dict().get("subaccount_name")
+        subaccount_owner = subaccount.subaccount_owner
+        subaccount_name = subaccount.subaccount_name
         if subaccount_owner is None or subaccount_name is None:
             raise ValueError("Missing `subaccount_owner` or `subaccount_name`")
         else:
-            return hex_to_bytes32(subaccount_owner + str_to_hex(subaccount_name))
+            return _owner_and_name_to_bytes32(subaccount_owner, subaccount_name)
     else:
         return subaccount
 
 
+@lru_cache(maxsize=1024)
+def _owner_and_name_to_bytes32(owner: str, name: str) -> bytes:
+    # Clients derive the same few subaccounts for every order, query and tx, so
+    # memoize on the (owner, name) strings. SubaccountParams itself isn't hashable.
+    return hex_to_bytes32(owner + str_to_hex(name))
+
+
 def subaccount_to_hex(
     subaccount: Subaccount, name: Optional[Union[str, bytes]] = None
 ) -> str:
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from copy import deepcopy
-from typing import Optional, Type, Union
+from typing import Iterator, Optional, Type, Union
 from eth_account.signers.local import LocalAccount
 from pydantic import validator
 from nado_protocol.contracts.eip712.sign import (
@@ -12,7 +12,7 @@ from nado_protocol.contracts.types import NadoExecuteType
 from nado_protocol.utils.backend import NadoClientOpts
 from nado_protocol.utils.bytes32 import subaccount_to_bytes32, subaccount_to_hex
 from nado_protocol.utils.model import NadoBaseModel
-from nado_protocol.utils.nonce import gen_order_nonce
+from nado_protocol.utils.nonce import gen_order_nonce, gen_order_nonces
 from nado_protocol.utils.order import gen_order_verifying_contract
 from nado_protocol.utils.subaccount import Subaccount, SubaccountParams
 
@@ -192,6 +192,22 @@ class NadoBaseExecute:
         """
         return gen_order_nonce(recv_time_ms)
 
+    def order_nonces(
+        self, count: int, recv_time_ms: Optional[int] = None
+    ) -> Iterator[int]:
+        """
+        Reserve a block of distinct order nonces up front, e.g: before placing several orders concurrently.
+
+        Args:
+            count (int): Number of nonces to reserve, between 0 and 1000.
+
+            recv_time_ms (int, optional): Received time in milliseconds.
+
+        Returns:
+            Iterator[int]: The reserved nonces, handed out with `next()`.
+        """
+        return iter(gen_order_nonces(count, recv_time_ms))
+
     def _inject_owner_if_needed(self, params: Type[BaseParams]) -> Type[BaseParams]:
         """
         Inject the owner if needed.
@@ -21,4 +21,4 @@ def get_expiration_timestamp(seconds_from_now: int) -> int:
     Returns:
         int: The expiration timestamp.
     """
-    return int(time.time()) + seconds_from_now
+    return time.time_ns() // 1_000_000_000 + seconds_from_now
@@ -11,13 +11,16 @@ Key Concepts:
 - Health = Assets - Liabilities, calculated per balance using oracle_price * weight
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from functools import lru_cache
 from time import time
 from typing import Optional, Union, TYPE_CHECKING
 from pydantic import BaseModel
 from nado_protocol.engine_client.types.models import (
     SpotProduct,
     PerpProduct,
+    ProductRisk,
     SpotProductBalance,
     PerpProductBalance,
     SubaccountHealth,
@@ -27,17 +30,42 @@ from nado_protocol.engine_client.types.query import SubaccountInfoData
 from nado_protocol.indexer_client.types.models import IndexerEvent
 from nado_protocol.indexer_client.types.query import IndexerAccountSnapshotsParams
 from nado_protocol.utils.bytes32 import subaccount_to_hex
+from nado_protocol.utils.math import from_x18_decimal
 
 if TYPE_CHECKING:
     from nado_protocol.client import NadoClient
 
 
-TEN_TO_18 = Decimal(10) ** 18
+@lru_cache(maxsize=1024)
+def _risk_weights_decimal(
+    long_weight_initial_x18: str,
+    long_weight_maintenance_x18: str,
+    short_weight_initial_x18: str,
+    short_weight_maintenance_x18: str,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    """Convert a product's x18 risk weights to Decimal, memoized by their raw values.
 
+    Risk weights are shared by every balance and wallet holding a product, so analyses
+    across many subaccounts reuse the same conversions. Keying on the values themselves
+    means updated weights are never served stale.
+    """
+    return (
+        from_x18_decimal(long_weight_initial_x18),
+        from_x18_decimal(long_weight_maintenance_x18),
+        from_x18_decimal(short_weight_initial_x18),
+        from_x18_decimal(short_weight_maintenance_x18),
+    )
 
-def _from_x18_decimal(value: Union[int, str]) -> Decimal:
-    """Convert an x18 fixed-point integer (str or int) to Decimal without precision loss."""
-    return Decimal(str(value)) / TEN_TO_18
+
+def _product_risk_weights(
+    risk: ProductRisk,
+) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+    return _risk_weights_decimal(
+        risk.long_weight_initial_x18,
+        risk.long_weight_maintenance_x18,
+        risk.short_weight_initial_x18,
+        risk.short_weight_maintenance_x18,
+    )
 
 
 class HealthMetrics(BaseModel):
@@ -217,22 +245,31 @@ class MarginManager:
                 )
             resolved_subaccount = subaccount_to_hex(signer.address, subaccount_name)
 
-        subaccount_info = engine_client.get_subaccount_info(resolved_subaccount)
-        isolated_positions_data = engine_client.get_isolated_positions(
-            resolved_subaccount
-        )
-        isolated_positions = isolated_positions_data.isolated_positions
-
-        indexer_events: list[IndexerEvent] = []
-        if include_indexer_events:
-            requested_timestamp = snapshot_timestamp or int(time())
-            indexer_events = cls._fetch_snapshot_events(
-                client,
-                resolved_subaccount,
-                requested_timestamp,
-                snapshot_isolated,
-                snapshot_active_only,
+        # The engine and indexer requests are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            subaccount_info_future = executor.submit(
+                engine_client.get_subaccount_info, resolved_subaccount
             )
+            isolated_positions_future = executor.submit(
+                engine_client.get_isolated_positions, resolved_subaccount
+            )
+            indexer_events_future = None
+            if include_indexer_events:
+                requested_timestamp = snapshot_timestamp or int(time())
+                indexer_events_future = executor.submit(
+                    cls._fetch_snapshot_events,
+                    client,
+                    resolved_subaccount,
+                    requested_timestamp,
+                    snapshot_isolated,
+                    snapshot_active_only,
+                )
+
+        subaccount_info = subaccount_info_future.result()
+        isolated_positions = isolated_positions_future.result().isolated_positions
+        indexer_events: list[IndexerEvent] = (
+            indexer_events_future.result() if indexer_events_future is not None else []
+        )
 
         return cls(
             subaccount_info,
@@ -266,11 +303,98 @@ class MarginManager:
         snapshots_for_subaccount = snapshots_map.get(subaccount) or next(
             iter(snapshots_map.values())
         )
+        return MarginManager._latest_snapshot_events(
+            snapshots_for_subaccount, timestamp
+        )
+
+    @classmethod
+    def fetch_snapshot_events_batched(
+        cls,
+        client: "NadoClient",
+        subaccounts: list[str],
+        timestamp: Optional[int] = None,
+        *,
+        isolated: Optional[bool] = False,
+        active_only: bool = True,
+        batch_size: int = 32,
+        max_workers: int = 4,
+    ) -> dict[str, list[IndexerEvent]]:
+        """
+        Fetch the latest indexer snapshot balances for many subaccounts.
+
+        Subaccounts are split into chunks of ``batch_size`` and each chunk is sent as a
+        single multi-subaccount snapshot request, with up to ``max_workers`` requests
+        in flight at once.
+
+        Args:
+            client: Configured Nado client with indexer connectivity.
+            subaccounts: Subaccount hexes (bytes32) to fetch snapshots for.
+            timestamp: Epoch seconds to request from the indexer. Defaults to
+                ``int(time.time())``.
+            isolated: Passed through to the indexer request, see ``from_client``.
+            active_only: When True (default), only live balances are returned.
+            batch_size: Maximum number of subaccounts per indexer request.
+            max_workers: Maximum number of concurrent indexer requests.
+
+        Returns:
+            Mapping of each requested subaccount to its snapshot events, suitable for
+            ``indexer_snapshot_events``. Subaccounts without a snapshot map to an empty list.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        requested_timestamp = timestamp or int(time())
+        indexer_client = client.context.indexer_client
+        batches = [
+            subaccounts[i : i + batch_size]
+            for i in range(0, len(subaccounts), batch_size)
+        ]
+
+        def fetch_batch(batch: list[str]) -> dict[str, dict[str, list[IndexerEvent]]]:
+            snapshot_response = indexer_client.get_multi_subaccount_snapshots(
+                IndexerAccountSnapshotsParams(
+                    subaccounts=batch,
+                    timestamps=[requested_timestamp],
+                    isolated=isolated,
+                    active=active_only,
+                )
+            )
+            return snapshot_response.snapshots or {}
+
+        # Subaccount hex casing may differ between request and response
+        snapshots_by_subaccount: dict[str, dict[str, list[IndexerEvent]]] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(batches)))
+        ) as executor:
+            for snapshots_map in executor.map(fetch_batch, batches):
+                for key, snapshots in snapshots_map.items():
+                    snapshots_by_subaccount[key.lower()] = snapshots
+
+        return {
+            subaccount: cls._latest_snapshot_events(
+                snapshots_by_subaccount.get(subaccount.lower()), requested_timestamp
+            )
+            for subaccount in subaccounts
+        }
+
+    @staticmethod
+    def _latest_snapshot_events(
+        snapshots_for_subaccount: Optional[dict[str, list[IndexerEvent]]],
+        timestamp: Optional[int] = None,
+    ) -> list[IndexerEvent]:
         if not snapshots_for_subaccount:
             return []
 
-        latest_key = max(snapshots_for_subaccount.keys(), key=int)
-        events = snapshots_for_subaccount.get(latest_key, [])
+        # A single timestamp is requested, so its key is normally present;
+        # only fall back to scanning for the latest key when it is not.
+        events = (
+            snapshots_for_subaccount.get(str(timestamp))
+            if timestamp is not None
+            else None
+        )
+        if events is None:
+            latest_key = max(snapshots_for_subaccount.keys(), key=int)
+            events = snapshots_for_subaccount.get(latest_key, [])
         return list(events) if events else []
 
     def calculate_account_summary(self) -> AccountSummary:
@@ -707,12 +831,12 @@ class MarginManager:
     def _has_borrows_or_perps(self) -> bool:
         """Check if account has any borrows or perp positions."""
         for spot_bal in self.subaccount_info.spot_balances:
-            amount = _from_x18_decimal(spot_bal.balance.amount)
+            amount = from_x18_decimal(spot_bal.balance.amount)
             if amount < 0:
                 return True
 
         for perp_bal in self.subaccount_info.perp_balances:
-            amount = _from_x18_decimal(perp_bal.balance.amount)
+            amount = from_x18_decimal(perp_bal.balance.amount)
             if amount != 0:
                 return True
 
@@ -724,7 +848,7 @@ class MarginManager:
 
     def _parse_health(self, health: SubaccountHealth) -> Decimal:
         """Parse health from SubaccountHealth model."""
-        return _from_x18_decimal(health.health)
+        return from_x18_decimal(health.health)
 
     def _create_spot_balances(self) -> list[BalanceWithProduct]:
         """Create BalanceWithProduct objects for all spot balances."""
@@ -753,30 +877,31 @@ class MarginManager:
         balance_type: str,
     ) -> BalanceWithProduct:
         """Create a BalanceWithProduct from raw balance and product data."""
-        amount = _from_x18_decimal(balance.balance.amount)
-        oracle_price = _from_x18_decimal(product.oracle_price_x18)
+        amount = from_x18_decimal(balance.balance.amount)
+        oracle_price = from_x18_decimal(product.oracle_price_x18)
 
         v_quote = None
         if balance_type == "perp":
             assert isinstance(
                 balance, PerpProductBalance
             ), "Perp balances must be PerpProductBalance"
-            v_quote = _from_x18_decimal(balance.balance.v_quote_balance)
+            v_quote = from_x18_decimal(balance.balance.v_quote_balance)
+
+        (
+            long_weight_initial,
+            long_weight_maintenance,
+            short_weight_initial,
+            short_weight_maintenance,
+        ) = _product_risk_weights(product.risk)
 
         return BalanceWithProduct(
             product_id=balance.product_id,
             amount=amount,
             oracle_price=oracle_price,
-            long_weight_initial=_from_x18_decimal(product.risk.long_weight_initial_x18),
-            long_weight_maintenance=_from_x18_decimal(
-                product.risk.long_weight_maintenance_x18
-            ),
-            short_weight_initial=_from_x18_decimal(
-                product.risk.short_weight_initial_x18
-            ),
-            short_weight_maintenance=_from_x18_decimal(
-                product.risk.short_weight_maintenance_x18
-            ),
+            long_weight_initial=long_weight_initial,
+            long_weight_maintenance=long_weight_maintenance,
+            short_weight_initial=short_weight_initial,
+            short_weight_maintenance=short_weight_maintenance,
             balance_type=balance_type,
             v_quote_balance=v_quote,
         )
@@ -1,6 +1,11 @@
 from decimal import Decimal
 from typing import Union
 
+# Powers of 10 looked up by the conversions below instead of recomputed per call.
+_POW_10 = tuple(10**i for i in range(64))
+_DECIMAL_X6 = Decimal(_POW_10[6])
+_DECIMAL_X18 = Decimal(_POW_10[18])
+
 
 def to_pow_10(x: int, pow: int) -> int:
     """
@@ -14,7 +19,7 @@ def to_pow_10(x: int, pow: int) -> int:
     Returns:
         int: Converted value.
     """
-    return x * 10**pow
+    return x * (_POW_10[pow] if 0 <= pow < len(_POW_10) else 10**pow)
 
 
 def to_x6(x: float) -> int:
@@ -27,7 +32,9 @@ def to_x6(x: float) -> int:
     Returns:
         int: Fixed point value represented as an integer.
     """
-    return int(Decimal(str(x)) * Decimal(10**6))
+    if type(x) is int:
+        return x * _POW_10[6]
+    return int(Decimal(str(x)) * _DECIMAL_X6)
 
 
 def to_x18(x: float) -> int:
@@ -40,7 +47,9 @@ def to_x18(x: float) -> int:
     Returns:
         int: Fixed point value represented as an integer.
     """
-    return int(Decimal(str(x)) * Decimal(10**18))
+    if type(x) is int:
+        return x * _POW_10[18]
+    return int(Decimal(str(x)) * _DECIMAL_X18)
 
 
 def from_pow_10(x: int, pow: int) -> float:
@@ -84,6 +93,19 @@ def from_x18(x: int) -> float:
     return from_pow_10(x, 18)
 
 
+def from_x18_decimal(x: Union[int, str]) -> Decimal:
+    """
+    Reverts integer from power of 10^18 format without a float round-trip.
+
+    Args:
+        x (int | str): Converted value.
+
+    Returns:
+        Decimal: Original value.
+    """
+    return Decimal(str(x)) / _DECIMAL_X18
+
+
 def mul_x18(x: Union[float, str], y: Union[float, str]) -> int:
     return int(Decimal(str(x)) * Decimal(str(y)) / Decimal(10**18))
 
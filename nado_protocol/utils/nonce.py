@@ -1,8 +1,17 @@
-from typing import Optional
+from typing import Optional, List
 from datetime import timezone, datetime, timedelta
 import random
 
 
+def _default_recv_time_ms() -> int:
+    """
+    Returns the default received timestamp for order nonces: the current time plus 90 seconds, in milliseconds.
+    """
+    return int(
+        (datetime.now(tz=timezone.utc) + timedelta(seconds=90)).timestamp() * 1000
+    )
+
+
 def gen_order_nonce(
     recv_time_ms: Optional[int] = None,
     random_int: Optional[int] = None,
@@ -19,11 +28,34 @@ def gen_order_nonce(
         int: The generated order nonce.
     """
     if recv_time_ms is None:
-        recv_time_ms = int(
-            (datetime.now(tz=timezone.utc) + timedelta(seconds=90)).timestamp() * 1000
-        )
+        recv_time_ms = _default_recv_time_ms()
     if random_int is None:
         random_int = random.randint(0, 999)
 
     nonce = (recv_time_ms << 20) + random_int
     return nonce
+
+
+def gen_order_nonces(count: int, recv_time_ms: Optional[int] = None) -> List[int]:
+    """
+    Generates multiple distinct order nonces at once, e.g: for orders placed concurrently or in one batch.
+
+    All nonces share a single received timestamp and draw distinct random integers, so they never collide
+    with each other the way independent `gen_order_nonce` calls within the same millisecond can.
+
+    Args:
+        count (int): Number of nonces to generate, between 0 and 1000.
+
+        recv_time_ms (int, optional): Received timestamp in milliseconds. Defaults to the current time plus 90 seconds.
+
+    Returns:
+        List[int]: The generated order nonces.
+    """
+    if not 0 <= count <= 1000:
+        raise ValueError("count must be between 0 and 1000")
+    if recv_time_ms is None:
+        recv_time_ms = _default_recv_time_ms()
+    return [
+        gen_order_nonce(recv_time_ms, random_int)
+        for random_int in random.sample(range(1000), count)
+    ]
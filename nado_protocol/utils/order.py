@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 from enum import IntEnum
 from nado_protocol.utils.expiration import OrderType
@@ -56,6 +57,13 @@ class OrderAppendixTriggerType(IntEnum):
     TWAP_CUSTOM_AMOUNTS = 3
 
 
+# Trigger types carrying TWAP data in the value bits. IntEnum members hash like their
+# int values, so raw trigger bits can be checked against this set without building an enum.
+_TWAP_TRIGGER_TYPES = frozenset(
+    {OrderAppendixTriggerType.TWAP, OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS}
+)
+
+
 class TWAPBitFields:
     """Bit field definitions for TWAP value packing within the 64-bit value field."""
 
@@ -109,6 +117,7 @@ def unpack_twap_appendix_value(value: int) -> tuple[int, float]:
     return int(times), slippage_frac
 
 
+@lru_cache(maxsize=1024)
 def build_appendix(
     order_type: OrderType,
     isolated: bool = False,
@@ -138,24 +147,22 @@ def build_appendix(
     Returns:
         int: The built appendix value with version set to APPENDIX_VERSION.
 
+    Note:
+        Results are memoized per unique argument combination, so repeated orders with the
+        same parameters (e.g: TWAP placements) skip re-packing the bit fields.
+
     Raises:
         ValueError: If parameters are invalid or incompatible.
     """
     if isolated_margin is not None and not isolated:
         raise ValueError("isolated_margin can only be set when isolated=True")
 
-    if (
-        isolated
-        and trigger_type is not None
-        and trigger_type
-        in [OrderAppendixTriggerType.TWAP, OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS]
-    ):
+    is_twap = trigger_type in _TWAP_TRIGGER_TYPES
+
+    if isolated and is_twap:
         raise ValueError("An order cannot be both isolated and a TWAP order")
 
-    if trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
+    if is_twap:
         if twap_times is None or twap_slippage_frac is None:
             raise ValueError(
                 "twap_times and twap_slippage_frac are required for TWAP orders"
@@ -210,10 +217,7 @@ def build_appendix(
         appendix |= (
             isolated_margin & AppendixBitFields.VALUE_MASK
         ) << AppendixBitFields.VALUE_SHIFT
-    elif trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
+    elif is_twap:
         # TWAP value (bits 127..64) - 64 bits
         # These are guaranteed to be non-None due to validation above
         assert twap_times is not None
@@ -235,9 +239,13 @@ def gen_order_verifying_contract(product_id: int) -> str:
 
     Returns:
         str: The generated order verifying contract address in hexadecimal format.
+
+    Raises:
+        OverflowError: If the product ID does not fit in an unsigned 20-byte integer.
     """
-    be_bytes = product_id.to_bytes(20, byteorder="big", signed=False)
-    return "0x" + be_bytes.hex()
+    if not 0 <= product_id < 1 << 160:
+        raise OverflowError(f"product_id {product_id} does not fit in 20 bytes")
+    return f"0x{product_id:040x}"
 
 
 def order_reduce_only(appendix: int) -> bool:
@@ -347,11 +355,10 @@ def order_twap_data(appendix: int) -> Optional[tuple[int, float]]:
     Returns:
         Optional[tuple[int, float]]: Tuple of (times, slippage_frac) if TWAP, None otherwise.
     """
-    trigger_type = order_trigger_type(appendix)
-    if trigger_type is not None and trigger_type in [
-        OrderAppendixTriggerType.TWAP,
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS,
-    ]:
+    trigger_bits = (
+        appendix >> AppendixBitFields.TRIGGER_TYPE_SHIFT
+    ) & AppendixBitFields.TRIGGER_TYPE_MASK
+    if trigger_bits in _TWAP_TRIGGER_TYPES:
         twap_value = (
             appendix >> AppendixBitFields.VALUE_SHIFT
         ) & AppendixBitFields.VALUE_MASK
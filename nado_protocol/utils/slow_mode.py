@@ -5,7 +5,7 @@ Slow mode transactions are submitted directly to the Endpoint contract
 via `submitSlowModeTransaction(bytes)`.
 """
 
-from eth_abi import encode
+import struct
 
 
 # Slow mode transaction type constants
@@ -13,6 +13,11 @@ class SlowModeTxType:
     CLAIM_BUILDER_FEE = 31
 
 
+# ABI layout of (bytes32 sender, uint32 builderId) prefixed by the tx type byte: the sender
+# word followed by builderId left-padded to a 32-byte big-endian word (28 zero bytes + uint32).
+_CLAIM_BUILDER_FEE_TX = struct.Struct(">B32s28xI")
+
+
 def encode_claim_builder_fee_tx(sender: bytes, builder_id: int) -> bytes:
     """
     Encodes a ClaimBuilderFee slow mode transaction.
@@ -26,6 +31,9 @@ def encode_claim_builder_fee_tx(sender: bytes, builder_id: int) -> bytes:
     Returns:
         bytes: The encoded transaction ready for submission.
 
+    Raises:
+        ValueError: If sender is not 32 bytes or builder_id does not fit in a uint32.
+
     Example:
         ```python
         from nado_protocol.utils.slow_mode import encode_claim_builder_fee_tx
@@ -40,9 +48,9 @@ def encode_claim_builder_fee_tx(sender: bytes, builder_id: int) -> bytes:
     """
     if len(sender) != 32:
         raise ValueError("sender must be 32 bytes")
+    if not 0 <= builder_id < 1 << 32:
+        raise ValueError("builder_id must be a uint32")
 
-    # Encode the parameters: (bytes32 sender, uint32 builderId)
-    tx_bytes = encode(["bytes32", "uint32"], [sender, builder_id])
-
-    # Prepend the transaction type byte
-    return bytes([SlowModeTxType.CLAIM_BUILDER_FEE]) + tx_bytes
+    return _CLAIM_BUILDER_FEE_TX.pack(
+        SlowModeTxType.CLAIM_BUILDER_FEE, sender, builder_id
+    )
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 from nado_protocol.utils.order import (
     build_appendix,
     OrderAppendixTriggerType,
@@ -6,12 +6,15 @@ from nado_protocol.utils.order import (
 from nado_protocol.utils.expiration import OrderType
 from nado_protocol.utils.execute import OrderParams
 
+if TYPE_CHECKING:
+    from nado_protocol.trigger_client.types.execute import PlaceTriggerOrderParams
+
 
 def create_twap_order(
     product_id: int,
     sender: str,
-    price_x18: str,
-    total_amount_x18: str,
+    price_x18: Union[int, str],
+    total_amount_x18: Union[int, str],
     expiration: int,
     nonce: int,
     times: int,
@@ -21,15 +24,15 @@ def create_twap_order(
     reduce_only: bool = False,
     spot_leverage: Optional[bool] = None,
     id: Optional[int] = None,
-):
+) -> "PlaceTriggerOrderParams":
     """
     Create a TWAP (Time-Weighted Average Price) order.
 
     Args:
         product_id (int): The product ID for the order.
         sender (str): The sender address (32 bytes hex).
-        price_x18 (str): The limit price multiplied by 1e18.
-        total_amount_x18 (str): The total amount to trade multiplied by 1e18 (signed, negative for sell).
+        price_x18 (Union[int, str]): The limit price multiplied by 1e18.
+        total_amount_x18 (Union[int, str]): The total amount to trade multiplied by 1e18 (signed, negative for sell).
         expiration (int): Order expiration timestamp.
         nonce (int): Order nonce.
         times (int): Number of TWAP executions (1-500).
@@ -47,10 +50,6 @@ def create_twap_order(
     Raises:
         ValueError: If parameters are invalid.
     """
-    # Import here to avoid circular imports
-    from nado_protocol.trigger_client.types.models import TimeTrigger
-    from nado_protocol.trigger_client.types.execute import PlaceTriggerOrderParams
-
     if times < 1 or times > 500:
         raise ValueError(f"TWAP times must be between 1 and 500, got {times}")
 
@@ -62,14 +61,50 @@ def create_twap_order(
     if interval_seconds <= 0:
         raise ValueError(f"Interval must be positive, got {interval_seconds}")
 
-    # Determine trigger type
-    trigger_type = (
-        OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS
-        if custom_amounts_x18 is not None
-        else OrderAppendixTriggerType.TWAP
+    return _build_twap_order(
+        trigger_type=(
+            OrderAppendixTriggerType.TWAP
+            if custom_amounts_x18 is None
+            else OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS
+        ),
+        product_id=product_id,
+        sender=sender,
+        price_x18=price_x18,
+        total_amount_x18=total_amount_x18,
+        expiration=expiration,
+        nonce=nonce,
+        times=times,
+        slippage_frac=slippage_frac,
+        interval_seconds=interval_seconds,
+        amounts=custom_amounts_x18,
+        reduce_only=reduce_only,
+        spot_leverage=spot_leverage,
+        id=id,
     )
 
-    # Build appendix - TWAP orders must use IOC execution type
+
+def _build_twap_order(
+    trigger_type: OrderAppendixTriggerType,
+    product_id: int,
+    sender: str,
+    price_x18: Union[int, str],
+    total_amount_x18: Union[int, str],
+    expiration: int,
+    nonce: int,
+    times: int,
+    slippage_frac: float,
+    interval_seconds: int,
+    amounts: Optional[List[str]],
+    reduce_only: bool,
+    spot_leverage: Optional[bool],
+    id: Optional[int],
+) -> "PlaceTriggerOrderParams":
+    # Import here to avoid circular imports
+    from nado_protocol.trigger_client.types.models import TimeTrigger, TimeTriggerData
+    from nado_protocol.trigger_client.types.execute import PlaceTriggerOrderParams
+
+    # Build appendix - TWAP orders must use IOC execution type. All arguments are
+    # hashable, so repeated TWAP shapes hit the build_appendix cache.
     appendix = build_appendix(
         order_type=OrderType.IOC,
         reduce_only=reduce_only,
@@ -88,17 +123,17 @@ def create_twap_order(
         appendix=appendix,
     )
 
-    # Create trigger criteria
-    from nado_protocol.trigger_client.types.models import TimeTriggerData
-
-    trigger = TimeTrigger(
-        time_trigger=TimeTriggerData(
+    # All fields below are built from typed inputs or the validated order above, so use
+    # construct() to avoid walking up to 500 custom amounts through validation again.
+    # construct() skips coercion, so stringify amounts here to keep them strings on the wire.
+    trigger = TimeTrigger.construct(
+        time_trigger=TimeTriggerData.construct(
             interval=interval_seconds,
-            amounts=custom_amounts_x18,
+            amounts=None if amounts is None else [str(amount) for amount in amounts],
         )
     )
 
-    return PlaceTriggerOrderParams(
+    return PlaceTriggerOrderParams.construct(
         product_id=product_id,
         order=order_params,
         trigger=trigger,
@@ -110,7 +145,7 @@ def create_twap_order(
 
 
 def validate_twap_order(
-    total_amount_x18: str,
+    total_amount_x18: Union[int, str],
     times: int,
     custom_amounts_x18: Optional[List[str]] = None,
 ) -> None:
@@ -118,18 +153,17 @@ def validate_twap_order(
     Validate TWAP order parameters.
 
     Args:
-        total_amount_x18 (str): The total amount to trade multiplied by 1e18.
+        total_amount_x18 (Union[int, str]): The total amount to trade multiplied by 1e18.
         times (int): Number of TWAP executions.
         custom_amounts_x18 (Optional[List[str]]): Custom amounts for each execution multiplied by 1e18.
 
     Raises:
         ValueError: If validation fails.
     """
-    total_amount_int = int(total_amount_x18)
-
     if custom_amounts_x18 is None:
         # For equal distribution, total amount must be divisible by times
-        if total_amount_int % times != 0:
+        _, remainder = equal_amount_per_execution(total_amount_x18, times)
+        if remainder != 0:
             raise ValueError(
                 f"Total amount {total_amount_x18} must be divisible by times {times} "
                 f"for equal distribution TWAP orders"
@@ -142,7 +176,8 @@ def validate_twap_order(
                 f"times ({times})"
             )
 
-        custom_sum = sum(int(amount) for amount in custom_amounts_x18)
+        total_amount_int = int(total_amount_x18)
+        custom_sum = sum(map(int, custom_amounts_x18))
         if custom_sum != total_amount_int:
             raise ValueError(
                 f"Sum of custom amounts ({custom_sum}) must equal "
@@ -164,12 +199,28 @@ def estimate_twap_completion_time(times: int, interval_seconds: int) -> int:
     return (times - 1) * interval_seconds
 
 
-def calculate_equal_amounts(total_amount_x18: str, times: int) -> List[str]:
+def equal_amount_per_execution(
+    total_amount_x18: Union[int, str], times: int
+) -> Tuple[int, int]:
+    """
+    Split a TWAP total amount evenly across executions.
+
+    Args:
+        total_amount_x18 (Union[int, str]): The total amount to distribute multiplied by 1e18.
+        times (int): Number of executions.
+
+    Returns:
+        Tuple[int, int]: The amount per execution multiplied by 1e18 and the undistributed remainder.
+    """
+    return divmod(int(total_amount_x18), times)
+
+
+def calculate_equal_amounts(total_amount_x18: Union[int, str], times: int) -> List[str]:
     """
     Calculate equal amounts for TWAP executions.
 
     Args:
-        total_amount_x18 (str): The total amount to distribute multiplied by 1e18.
+        total_amount_x18 (Union[int, str]): The total amount to distribute multiplied by 1e18.
         times (int): Number of executions.
 
     Returns:
@@ -178,12 +229,13 @@ def calculate_equal_amounts(total_amount_x18: str, times: int) -> List[str]:
     Raises:
         ValueError: If total amount is not divisible by times.
     """
-    total_amount_int = int(total_amount_x18)
+    amount_per_execution, remainder = equal_amount_per_execution(
+        total_amount_x18, times
+    )
 
-    if total_amount_int % times != 0:
+    if remainder != 0:
         raise ValueError(
             f"Total amount {total_amount_x18} is not divisible by times {times}"
         )
 
-    amount_per_execution = total_amount_int // times
     return [str(amount_per_execution)] * times
@@ -12,7 +12,13 @@ Tests:
 Cleanup: Cancel order if still open
 """
 
+import json
+import os
 import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
 from eth_account import Account
 
 from sanity import (
@@ -33,14 +39,16 @@ from nado_protocol.engine_client.types.execute import (
     PlaceOrderParams,
     OrderParams,
 )
+from nado_protocol.engine_client.types.query import ContractsData
 from nado_protocol.indexer_client import IndexerClient
 from nado_protocol.indexer_client.types.models import IndexerEventType
 from nado_protocol.indexer_client.types.query import (
     IndexerEventsParams,
     IndexerEventsRawLimit,
+    IndexerHistoricalOrdersData,
     IndexerMatchesParams,
 )
-from nado_protocol.utils.bytes32 import subaccount_to_bytes32, subaccount_to_hex
+from nado_protocol.utils.bytes32 import bytes32_to_hex, subaccount_to_bytes32
 from nado_protocol.utils.expiration import OrderType, get_expiration_timestamp
 from nado_protocol.utils.math import to_pow_10, to_x18
 from nado_protocol.utils.nonce import gen_order_nonce
@@ -53,13 +61,83 @@ from nado_protocol.utils.order import (
 from nado_protocol.utils.slow_mode import SlowModeTxType, encode_claim_builder_fee_tx
 from nado_protocol.utils.subaccount import SubaccountParams
 
+CONTRACTS_CACHE_PATH = Path(f"~/.nado/contracts-{NETWORK}.json").expanduser()
+CONTRACTS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 
-def run():
+
+def get_contracts_cached(engine_client: EngineClient) -> ContractsData:
+    """
+    Returns the deployment's contracts, reading them from a per-network cache file when it is fresh enough.
+
+    The endpoint address and chain id don't change within a deployment, so they are only fetched from the engine
+    when the cache file is missing, unreadable or older than `CONTRACTS_CACHE_TTL_SECONDS`.
+    """
+    try:
+        if (
+            time.time() - CONTRACTS_CACHE_PATH.stat().st_mtime
+            <= CONTRACTS_CACHE_TTL_SECONDS
+        ):
+            return ContractsData.parse_file(CONTRACTS_CACHE_PATH)
+    except (OSError, ValueError):
+        pass
+
+    contracts_data = engine_client.get_contracts()
+    try:
+        CONTRACTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CONTRACTS_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(contracts_data.dict()))
+        os.replace(tmp_path, CONTRACTS_CACHE_PATH)
+    except OSError as e:
+        print(f"  failed to cache contracts: {e}")
+    return contracts_data
+
+
+def wait_for_historical_order(
+    indexer_client: IndexerClient,
+    order_digest: str,
+    timeout: float = 5.0,
+    poll_interval: float = 0.1,
+) -> IndexerHistoricalOrdersData:
+    """
+    Polls the indexer until the order with the given digest shows up or the timeout elapses.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        historical_orders = indexer_client.get_historical_orders_by_digest(
+            [order_digest]
+        )
+        if historical_orders.orders or time.monotonic() >= deadline:
+            return historical_orders
+        time.sleep(poll_interval)
+
+
+def oracle_price_110pct(oracle_price_x18: int) -> int:
+    """
+    Prices a buy order well above market to ensure a fill (110% of oracle),
+    rounded down to the nearest price_increment_x18 (1e18).
+    """
+    price_increment = 10**18
+    # Integer math: x18 prices exceed 2**53, so a float multiply would lose precision
+    order_price_x18 = oracle_price_x18 * 11 // 10
+    return (order_price_x18 // price_increment) * price_increment
+
+
+def run(
+    test_builder_id: int = 2,
+    test_builder_fee_rate: int = 50,  # 5 bps (within builder 2's range of 0.2-5 bps)
+    order_price_fn: Callable[[int], int] = oracle_price_110pct,
+):
+    """
+    Runs the builder sanity tests.
+
+    Args:
+        test_builder_id (int): Builder to attach to the test order and claim fees for.
+        test_builder_fee_rate (int): Builder fee rate in units of 0.1 bps.
+        order_price_fn (Callable[[int], int]): Maps the product's oracle price (x18) to the test order's price (x18).
+    """
     print("=== Builder Code Sanity Tests ===\n")
 
     signer = Account.from_key(SIGNER_PRIVATE_KEY)
-    test_builder_id = 2
-    test_builder_fee_rate = 50  # 5 bps (within builder 2's range of 0.2-5 bps)
 
     # Test 1: Appendix encoding with builder fields
     print("Test 1: Testing appendix encoding with builder fields")
@@ -104,30 +182,31 @@ def run():
 
     # Test 3: Place order with builder info
     print("Test 3: Placing order with builder info")
+    # Engine and indexer requests share one keep-alive connection pool
+    session = requests.Session()
     engine_client = EngineClient(
-        opts=EngineClientOpts(url=ENGINE_BACKEND_URL, signer=SIGNER_PRIVATE_KEY)
+        opts=EngineClientOpts(url=ENGINE_BACKEND_URL, signer=SIGNER_PRIVATE_KEY),
+        session=session,
     )
 
-    contracts_data = engine_client.get_contracts()
+    # Contracts and products are independent reads, so overlap them. The oracle price
+    # from get_all_products is used to keep the order within the 80-120% range.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        contracts_future = executor.submit(get_contracts_cached, engine_client)
+        all_products_future = executor.submit(engine_client.get_all_products)
+    contracts_data = contracts_future.result()
+    all_products = all_products_future.result()
     engine_client.endpoint_addr = contracts_data.endpoint_addr
     engine_client.chain_id = contracts_data.chain_id
 
     product_id = 2  # BTC-PERP
 
-    # Get oracle price to ensure order is within 80-120% range
-    all_products = engine_client.get_all_products()
-    perp_product = next(
-        (p for p in all_products.perp_products if p.product_id == product_id), None
-    )
+    perp_product = all_products.perp_by_id.get(product_id)
     if perp_product is None:
         raise Exception(f"Product {product_id} not found")
     oracle_price_x18 = int(perp_product.oracle_price_x18)
 
-    # Place a buy order well above market to ensure fill (110% of oracle)
-    # Round down to nearest price_increment_x18 (1e18)
-    price_increment = 10**18
-    order_price_x18 = int(oracle_price_x18 * 1.10)
-    order_price_x18 = (order_price_x18 // price_increment) * price_increment
+    order_price_x18 = order_price_fn(oracle_price_x18)
 
     builder_order = OrderParams(
         sender=SubaccountParams(
@@ -143,9 +222,7 @@ def run():
     order_digest = engine_client.get_order_digest(builder_order, product_id)
     print(f"  order digest: {order_digest}")
 
-    sender_hex = subaccount_to_hex(
-        SubaccountParams(subaccount_owner=signer.address, subaccount_name="default")
-    )
+    sender_hex = bytes32_to_hex(sender_bytes)
 
     order_placed = False
     try:
@@ -163,15 +240,13 @@ def run():
             return
         raise e
 
-    # Wait for order to process
-    print("  waiting for order to process...")
-    time.sleep(2)
-
     # Test 4: Query historical order for builder fee
     print("\nTest 4: Querying historical order for builder fee")
-    indexer_client = IndexerClient(opts={"url": INDEXER_BACKEND_URL})
+    indexer_client = IndexerClient(opts={"url": INDEXER_BACKEND_URL}, session=session)
 
-    historical_orders = indexer_client.get_historical_orders_by_digest([order_digest])
+    # Poll until the order is indexed instead of sleeping for a fixed period
+    print("  waiting for order to be indexed...")
+    historical_orders = wait_for_historical_order(indexer_client, order_digest)
 
     if historical_orders.orders:
         order = historical_orders.orders[0]
@@ -184,9 +259,9 @@ def run():
 
         # Check appendix has builder info
         if order.appendix:
-            appendix_int = int(order.appendix)
-            appendix_builder_id = order_builder_id(appendix_int)
-            appendix_fee_rate = order_builder_fee_rate(appendix_int)
+            appendix_builder_id, appendix_fee_rate = order_builder_info(
+                int(order.appendix)
+            ) or (None, None)
             print(f"  appendix.builder.builderId: {appendix_builder_id}")
             print(f"  appendix.builder.builderFeeRate: {appendix_fee_rate}")
             if appendix_builder_id != test_builder_id:
@@ -233,8 +308,8 @@ def run():
     slow_mode_fee = to_pow_10(1, 6)  # 1 USDT
     try:
         approve_tx = nado_contracts.approve_allowance(usdt_token, slow_mode_fee, signer)
+        # approve_allowance only returns once the approval tx receipt is available
         print(f"  ✓ Slow mode fee approved: {approve_tx}")
-        time.sleep(5)  # Wait for approval tx to be mined
     except Exception as e:
         print(f"  approval failed (may already be approved): {e}")
 
@@ -254,13 +329,15 @@ def run():
         # Test 7: Poll for claim_builder_fee event
         print("\nTest 7: Polling for claim_builder_fee event...")
         max_attempts = 10
-        poll_interval = 2
+        # Back off exponentially between misses: most events land within the first
+        # second or two, while the 3s cap keeps the total wait close to ~17s.
+        poll_delay = 0.25
+        max_poll_delay = 3.0
         found = False
 
+        # Query right away and only sleep between misses, so an event that is
+        # already indexed is picked up without waiting a full poll interval.
         for attempt in range(1, max_attempts + 1):
-            if found:
-                break
-            time.sleep(poll_interval)
             events_data = indexer_client.get_events(
                 IndexerEventsParams(
                     subaccounts=[sender_hex],
@@ -270,15 +347,9 @@ def run():
             )
 
             # Match events to txs by submission_idx to get timestamp
+            txs_by_submission_idx = {t.submission_idx: t for t in events_data.txs}
             for event in events_data.events:
-                tx = next(
-                    (
-                        t
-                        for t in events_data.txs
-                        if t.submission_idx == event.submission_idx
-                    ),
-                    None,
-                )
+                tx = txs_by_submission_idx.get(event.submission_idx)
                 if tx and tx.timestamp and int(tx.timestamp) >= claim_submit_time - 10:
                     print(
                         f"  Found claim_builder_fee event on attempt {attempt} (timestamp: {tx.timestamp})"
@@ -287,8 +358,12 @@ def run():
                     found = True
                     break
 
-            if not found:
-                print(f"  Attempt {attempt}/{max_attempts}: not found yet...")
+            if found:
+                break
+            print(f"  Attempt {attempt}/{max_attempts}: not found yet...")
+            if attempt < max_attempts:
+                time.sleep(poll_delay)
+                poll_delay = min(poll_delay * 1.7, max_poll_delay)
 
         if not found:
             print(
@@ -87,9 +87,7 @@ def run():
     all_products = client.get_all_products()
 
     # Get WBTC (product_id=1) oracle price for spot order
-    spot_product = next(
-        (p for p in all_products.spot_products if p.product_id == 1), None
-    )
+    spot_product = all_products.spot_by_id.get(1)
     if spot_product is None:
         raise Exception("WBTC product not found")
     spot_oracle_price_x18 = int(spot_product.oracle_price_x18)
@@ -99,9 +97,7 @@ def run():
     spot_order_price_x18 = (spot_order_price_x18 // price_increment) * price_increment
 
     # Get BTC-PERP (product_id=2) oracle price for perp order
-    perp_product = next(
-        (p for p in all_products.perp_products if p.product_id == 2), None
-    )
+    perp_product = all_products.perp_by_id.get(2)
     if perp_product is None:
         raise Exception("BTC-PERP product not found")
     perp_oracle_price_x18 = int(perp_product.oracle_price_x18)
@@ -7,13 +7,15 @@ It can analyze any public subaccount without requiring a private key.
 Usage:
     python -m sanity.margin_manager
 
+Run with ``python -O -m sanity.margin_manager`` to skip the snapshot inspection step.
+
 To analyze a specific wallet, set the TEST_WALLET constant below.
 """
 
 import sys
 import time
-from decimal import Decimal
-from nado_protocol.client import create_nado_client, NadoClientMode
+from functools import lru_cache
+from nado_protocol.client import NadoClient, create_nado_client, NadoClientMode
 from nado_protocol.utils.bytes32 import subaccount_to_hex
 from nado_protocol.utils.math import from_x18
 from nado_protocol.utils.margin_manager import MarginManager, print_account_summary
@@ -22,6 +24,50 @@ from nado_protocol.utils.margin_manager import MarginManager, print_account_summ
 # Example wallet from margin manager screenshot
 TEST_WALLET = "0x8D7d64d6cF1D4F018Dd101482Ac71Ad49e30c560"
 
+# Balance math below stays in x18 fixed-point ints; values are only scaled for display
+X18 = 10**18
+
+# Per-row templates for the detail sections, formatted once per balance
+SPOT_ROW_FMT = (
+    "\n  [{index}] Product ID {product_id}\n"
+    "      Type:         {kind}\n"
+    "      Amount:       {amount:,.6f}\n"
+    "      Oracle Price: ${price:,.2f}\n"
+    "      Value:        ${value:,.2f}\n"
+    "      Weights:\n"
+    "        Long Initial:  {long_initial:.4f}\n"
+    "        Long Maint:    {long_maint:.4f}\n"
+    "        Short Initial: {short_initial:.4f}\n"
+    "        Short Maint:   {short_maint:.4f}"
+)
+PERP_ROW_FMT = (
+    "\n  [{index}] Product ID {product_id}\n"
+    "      Type:          {kind}\n"
+    "      Size:          {size:,.6f}\n"
+    "      Oracle Price:  ${price:,.2f}\n"
+    "      Notional:      ${notional:,.2f}\n"
+    "      V Quote:       ${v_quote:,.2f}\n"
+    "      Position Value: ${value:,.2f}\n"
+    "      Weights:\n"
+    "        Long Initial:  {long_initial:.4f}\n"
+    "        Long Maint:    {long_maint:.4f}"
+)
+
+
+@lru_cache(maxsize=4)
+def get_client(mode: NadoClientMode) -> NadoClient:
+    """Create a read-only Nado client once per mode and reuse it (and its connection pools) across runs."""
+    return create_nado_client(mode)
+
+
+def _report(message: str):
+    """Print an error with its traceback and exit; traceback is only imported on failure."""
+    import traceback
+
+    print(f"  ✗ {message}")
+    traceback.print_exc()
+    sys.exit(1)
+
 
 def run():
     """Test margin manager with a real subaccount."""
@@ -33,7 +79,7 @@ def run():
     # Setup Nado client (read-only, no private key needed)
     print("\n[1/5] Setting up client...")
     try:
-        client = create_nado_client(NadoClientMode.TESTNET)
+        client = get_client(NadoClientMode.TESTNET)
     except Exception as e:
         print(f"  ✗ Error creating Nado client: {e}")
         sys.exit(1)
@@ -59,22 +105,19 @@ def run():
         print(f"  ✓ Found {len(margin_manager.isolated_positions)} isolated positions")
         print(f"  ✓ Retrieved {len(margin_manager.indexer_events)} indexer events")
     except Exception as e:
-        print(f"  ✗ Error fetching margin data: {e}")
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
-
-    # Inspect indexer snapshot events
-    print("\n[3/5] Inspecting indexer snapshot...")
-    indexer_snapshot_events = margin_manager.indexer_events
-    if indexer_snapshot_events:
-        print(f"  ✓ Retrieved {len(indexer_snapshot_events)} active balances")
-        first_balance = indexer_snapshot_events[0]
-        print(f"  Number of balances: {len(indexer_snapshot_events)}")
-        print(f"  First balance product_id: {first_balance.product_id}")
-    else:
-        print("  ⚠ Warning: No snapshot data found for requested timestamp")
+        _report(f"Error fetching margin data: {e}")
+
+    # Inspect indexer snapshot events (stripped when running with `python -O`)
+    if __debug__:
+        print("\n[3/5] Inspecting indexer snapshot...")
+        indexer_snapshot_events = margin_manager.indexer_events
+        if indexer_snapshot_events:
+            print(f"  ✓ Retrieved {len(indexer_snapshot_events)} active balances")
+            first_balance = indexer_snapshot_events[0]
+            print(f"  Number of balances: {len(indexer_snapshot_events)}")
+            print(f"  First balance product_id: {first_balance.product_id}")
+        else:
+            print("  ⚠ Warning: No snapshot data found for requested timestamp")
 
     # Calculate summary
     print("\n[4/5] Calculating account summary...")
@@ -82,11 +125,7 @@ def run():
         summary = margin_manager.calculate_account_summary()
         print("  ✓ Calculations complete")
     except Exception as e:
-        print(f"  ✗ Error calculating summary: {e}")
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
+        _report(f"Error calculating summary: {e}")
 
     # Display results
     print("\n[5/5] Displaying summary...")
@@ -99,94 +138,81 @@ def run():
 
     # Show raw health values from engine
     # healths is a list: [initial, maintenance, unweighted]
+    healths = subaccount_info.healths
     print("\n📋 RAW HEALTH VALUES (from engine)")
-    print(
-        f"  Initial Assets:      ${from_x18(int(subaccount_info.healths[0].assets)):,.2f}"
-    )
-    print(
-        f"  Initial Liabilities: ${from_x18(int(subaccount_info.healths[0].liabilities)):,.2f}"
-    )
-    print(
-        f"  Initial Health:      ${from_x18(int(subaccount_info.healths[0].health)):,.2f}"
-    )
+    print(f"  Initial Assets:      ${from_x18(int(healths[0].assets)):,.2f}")
+    print(f"  Initial Liabilities: ${from_x18(int(healths[0].liabilities)):,.2f}")
+    print(f"  Initial Health:      ${from_x18(int(healths[0].health)):,.2f}")
     print()
-    print(
-        f"  Maint Assets:        ${from_x18(int(subaccount_info.healths[1].assets)):,.2f}"
-    )
-    print(
-        f"  Maint Liabilities:   ${from_x18(int(subaccount_info.healths[1].liabilities)):,.2f}"
-    )
-    print(
-        f"  Maint Health:        ${from_x18(int(subaccount_info.healths[1].health)):,.2f}"
-    )
+    print(f"  Maint Assets:        ${from_x18(int(healths[1].assets)):,.2f}")
+    print(f"  Maint Liabilities:   ${from_x18(int(healths[1].liabilities)):,.2f}")
+    print(f"  Maint Health:        ${from_x18(int(healths[1].health)):,.2f}")
     print()
-    print(
-        f"  Unweighted Health:   ${from_x18(int(subaccount_info.healths[2].health)):,.2f}"
-    )
+    print(f"  Unweighted Health:   ${from_x18(int(healths[2].health)):,.2f}")
 
     # Show spot balances in detail
     if subaccount_info.spot_balances:
-        print("\n💵 SPOT BALANCES DETAIL")
+        # Buffer each section and write it with a single print call
+        lines = ["\n💵 SPOT BALANCES DETAIL"]
         for i, (balance, product) in enumerate(
             zip(subaccount_info.spot_balances, subaccount_info.spot_products)
         ):
-            amount = Decimal(from_x18(int(balance.balance.amount)))
-            oracle_price = Decimal(from_x18(int(product.oracle_price_x18)))
-            value = amount * oracle_price
-
-            if amount == 0:
+            # Most listed products have no balance, so skip them before any conversion
+            amount_x18 = int(balance.balance.amount)
+            if amount_x18 == 0:
                 continue
 
-            balance_type = "Deposit" if amount > 0 else "Borrow"
-            print(f"\n  [{i}] Product ID {balance.product_id}")
-            print(f"      Type:         {balance_type}")
-            print(f"      Amount:       {amount:,.6f}")
-            print(f"      Oracle Price: ${oracle_price:,.2f}")
-            print(f"      Value:        ${value:,.2f}")
-            print(f"      Weights:")
-            print(
-                f"        Long Initial:  {from_x18(int(product.risk.long_weight_initial_x18)):.4f}"
-            )
-            print(
-                f"        Long Maint:    {from_x18(int(product.risk.long_weight_maintenance_x18)):.4f}"
-            )
-            print(
-                f"        Short Initial: {from_x18(int(product.risk.short_weight_initial_x18)):.4f}"
-            )
-            print(
-                f"        Short Maint:   {from_x18(int(product.risk.short_weight_maintenance_x18)):.4f}"
+            oracle_price_x18 = int(product.oracle_price_x18)
+            value_x18 = amount_x18 * oracle_price_x18 // X18
+
+            risk = product.risk
+            lines.append(
+                SPOT_ROW_FMT.format(
+                    index=i,
+                    product_id=balance.product_id,
+                    kind="Deposit" if amount_x18 > 0 else "Borrow",
+                    amount=from_x18(amount_x18),
+                    price=from_x18(oracle_price_x18),
+                    value=from_x18(value_x18),
+                    long_initial=from_x18(int(risk.long_weight_initial_x18)),
+                    long_maint=from_x18(int(risk.long_weight_maintenance_x18)),
+                    short_initial=from_x18(int(risk.short_weight_initial_x18)),
+                    short_maint=from_x18(int(risk.short_weight_maintenance_x18)),
+                )
             )
+        print("\n".join(lines))
 
     # Show perp balances in detail
     if subaccount_info.perp_balances:
-        print("\n🔄 PERP BALANCES DETAIL")
+        lines = ["\n🔄 PERP BALANCES DETAIL"]
         for i, (balance, product) in enumerate(
             zip(subaccount_info.perp_balances, subaccount_info.perp_products)
         ):
-            amount = Decimal(from_x18(int(balance.balance.amount)))
-            if amount == 0:
+            bal = balance.balance
+            amount_x18 = int(bal.amount)
+            if amount_x18 == 0:
                 continue
 
-            oracle_price = Decimal(from_x18(int(product.oracle_price_x18)))
-            v_quote = Decimal(from_x18(int(balance.balance.v_quote_balance)))
-            notional = abs(amount * oracle_price)
-            position_value = amount * oracle_price + v_quote
-
-            position_type = "Long" if amount > 0 else "Short"
-            print(f"\n  [{i}] Product ID {balance.product_id}")
-            print(f"      Type:          {position_type}")
-            print(f"      Size:          {amount:,.6f}")
-            print(f"      Oracle Price:  ${oracle_price:,.2f}")
-            print(f"      Notional:      ${notional:,.2f}")
-            print(f"      V Quote:       ${v_quote:,.2f}")
-            print(f"      Position Value: ${position_value:,.2f}")
-            print(f"      Weights:")
-            print(
-                f"        Long Initial:  {from_x18(int(product.risk.long_weight_initial_x18)):.4f}"
-            )
-            print(
-                f"        Long Maint:    {from_x18(int(product.risk.long_weight_maintenance_x18)):.4f}"
+            oracle_price_x18 = int(product.oracle_price_x18)
+            v_quote_x18 = int(bal.v_quote_balance)
+            position_notional_x18 = amount_x18 * oracle_price_x18 // X18
+
+            risk = product.risk
+            lines.append(
+                PERP_ROW_FMT.format(
+                    index=i,
+                    product_id=balance.product_id,
+                    kind="Long" if amount_x18 > 0 else "Short",
+                    size=from_x18(amount_x18),
+                    price=from_x18(oracle_price_x18),
+                    notional=from_x18(abs(position_notional_x18)),
+                    v_quote=from_x18(v_quote_x18),
+                    value=from_x18(position_notional_x18 + v_quote_x18),
+                    long_initial=from_x18(int(risk.long_weight_initial_x18)),
+                    long_maint=from_x18(int(risk.long_weight_maintenance_x18)),
+                )
             )
+        print("\n".join(lines))
 
     print("\n" + "=" * 80)
     print("TEST COMPLETE ✓")
@@ -1,4 +1,5 @@
 from eth_account import Account
+from eth_account.messages import encode_structured_data, _hash_eip191_message
 from nado_protocol.contracts.eip712.domain import (
     get_eip712_domain_type,
     get_nado_eip712_domain,
@@ -11,6 +12,7 @@ from nado_protocol.contracts.eip712.sign import (
 from nado_protocol.contracts.eip712.types import get_nado_eip712_type
 from nado_protocol.contracts.types import NadoTxType
 from nado_protocol.utils.order import gen_order_verifying_contract, build_appendix
+from nado_protocol.utils.bytes32 import hex_to_bytes32
 from nado_protocol.utils.expiration import OrderType
 import pytest
 
@@ -19,6 +21,14 @@ def test_order_verifying_contract():
     assert (
         gen_order_verifying_contract(18) == "0x0000000000000000000000000000000000000012"
     )
+    assert (
+        gen_order_verifying_contract((1 << 160) - 1)
+        == "0xffffffffffffffffffffffffffffffffffffffff"
+    )
+    with pytest.raises(OverflowError):
+        gen_order_verifying_contract(1 << 160)
+    with pytest.raises(OverflowError):
+        gen_order_verifying_contract(-1)
 
 
 def test_build_eip712_domain(
@@ -360,6 +370,34 @@ def test_sign_eip712_typed_data(
         eip712_typed_data = build_eip712_typed_data(
             tx, msg, verifying_contract, chain_id
         )
-        # raises an exception if signing fails
-        sign_eip712_typed_data(eip712_typed_data, signer)
+        # matches eth_account's reference encoding, incl. the cached domain separator
+        reference = encode_structured_data(eip712_typed_data.dict())
+        assert (
+            sign_eip712_typed_data(eip712_typed_data, signer)
+            == signer.sign_message(reference).signature.hex()
+        )
+        assert (
+            get_eip712_typed_data_digest(eip712_typed_data)
+            == f"0x{_hash_eip191_message(reference).hex()}"
+        )
+
+
+def test_eip712_typed_data_digest_empty_arrays(
+    senders: list[str], endpoint_addr: str, chain_id: int
+):
+    eip712_typed_data = build_eip712_typed_data(
+        NadoTxType.CANCEL_ORDERS,
+        {
+            "sender": hex_to_bytes32(senders[0]),
+            "productIds": [],
+            "digests": [],
+            "nonce": 1,
+        },
+        endpoint_addr,
+        chain_id,
+    )
+    reference = encode_structured_data(eip712_typed_data.dict())
+    assert (
         get_eip712_typed_data_digest(eip712_typed_data)
+        == f"0x{_hash_eip191_message(reference).hex()}"
+    )
@@ -1,5 +1,7 @@
+import requests
 from eth_account import Account
 from nado_protocol.engine_client import EngineClient, EngineClientOpts
+from nado_protocol.indexer_client import IndexerClient
 from eth_account.signers.local import LocalAccount
 from pydantic import ValidationError
 import pytest
@@ -97,3 +99,15 @@ def test_create_client_all_opts(
         == client_from_opts.endpoint_addr
         == endpoint_addr
     )
+
+
+def test_create_client_shared_session(url: str):
+    engine_client = EngineClient({"url": url})
+    assert engine_client._querier.session is engine_client.session
+
+    session = requests.Session()
+    engine_client = EngineClient({"url": url}, session=session)
+    indexer_client = IndexerClient({"url": url}, session=session)
+    assert engine_client.session is session
+    assert engine_client._querier.session is session
+    assert indexer_client.session is session
@@ -1,5 +1,6 @@
 import time
-from nado_protocol.utils.nonce import gen_order_nonce
+import pytest
+from nado_protocol.utils.nonce import gen_order_nonce, gen_order_nonces
 
 
 def test_nonce():
@@ -7,3 +8,15 @@ def test_nonce():
     time_now = int(time.time()) * 1000
 
     assert (nonce >> 20) >= time_now and (nonce >> 20) <= time_now + 99 * 1000
+
+
+def test_nonces():
+    recv_time_ms = 1700000000000
+    nonces = gen_order_nonces(1000, recv_time_ms)
+
+    assert len(set(nonces)) == 1000
+    assert all(nonce >> 20 == recv_time_ms for nonce in nonces)
+    assert gen_order_nonces(0) == []
+
+    with pytest.raises(ValueError):
+        gen_order_nonces(1001)
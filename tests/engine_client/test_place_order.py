@@ -5,6 +5,7 @@ from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from nado_protocol.contracts.eip712.sign import (
     build_eip712_typed_data,
+    get_eip712_typed_data_digest,
     sign_eip712_typed_data,
 )
 from nado_protocol.engine_client import EngineClient
@@ -277,6 +278,31 @@ def test_place_order_execute_success(
     assert place_order_req.place_order.signature == expected_signature
 
 
+def test_get_order_digest_is_computed_locally(
+    engine_client: EngineClient, mock_post: MagicMock, senders: list[str]
+):
+    order = OrderParams(
+        sender=hex_to_bytes32(senders[0]),
+        priceX18=1000,
+        amount=1000,
+        expiration=1000,
+        nonce=1000,
+        appendix=0,
+    )
+
+    digest = engine_client.get_order_digest(order, 1)
+
+    assert digest == get_eip712_typed_data_digest(
+        build_eip712_typed_data(
+            NadoExecuteType.PLACE_ORDER,
+            order.dict(),
+            gen_order_verifying_contract(1),
+            engine_client.chain_id,
+        )
+    )
+    mock_post.assert_not_called()
+
+
 def test_place_order_execute_provide_full_params(
     mock_post: MagicMock, url: str, chain_id: int, private_keys: list[str]
 ):
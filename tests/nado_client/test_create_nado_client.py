@@ -94,6 +94,46 @@ def test_create_nado_client_context(
     )
 
 
+def test_create_nado_client_context_shared_session_pool(
+    mock_post: MagicMock,
+    mock_web3: MagicMock,
+    mock_load_abi: MagicMock,
+    private_keys: list[str],
+    url: str,
+    endpoint_addr: str,
+    querier_addr: str,
+    chain_id: int,
+):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "data": {
+            "endpoint_addr": endpoint_addr,
+            "chain_id": chain_id,
+        },
+    }
+    mock_post.return_value = mock_response
+
+    context = create_nado_client_context(
+        NadoClientContextOpts(
+            engine_endpoint_url=url,
+            indexer_endpoint_url=url,
+            trigger_endpoint_url=url,
+            rpc_node_url=url,
+            contracts_context=NadoContractsContext(
+                endpoint_addr=endpoint_addr, querier_addr=querier_addr
+            ),
+        ),
+        signer=private_keys[0],
+    )
+
+    assert context.trigger_client is not None
+    session = context.trigger_client.session
+    assert session is context.engine_client.session is context.indexer_client.session
+    assert session.get_adapter(f"{url}/execute")._pool_maxsize == 32
+
+
 def test_create_nado_client(
     mock_post: MagicMock,
     mock_web3: MagicMock,
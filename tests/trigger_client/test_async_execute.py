@@ -0,0 +1,84 @@
+import asyncio
+from unittest.mock import MagicMock
+from nado_protocol.trigger_client import AsyncTriggerExecuteClient, TriggerClientOpts
+
+
+def test_async_place_price_trigger_orders(
+    mock_place_trigger_order_response: MagicMock,
+    url: str,
+    chain_id: int,
+    endpoint_addr: str,
+    private_keys: list[str],
+    senders: list[str],
+):
+    client = AsyncTriggerExecuteClient(
+        TriggerClientOpts(
+            url=url,
+            chain_id=chain_id,
+            endpoint_addr=endpoint_addr,
+            signer=private_keys[0],
+        )
+    )
+
+    async def place_orders():
+        return await asyncio.gather(
+            *[
+                client.aplace_price_trigger_order(
+                    product_id=1,
+                    sender=senders[0],
+                    price_x18="50000000000000000000000",
+                    amount_x18="1000000000000000000",
+                    trigger_price_x18="49000000000000000000000",
+                    trigger_type="last_price_below",
+                    expiration=1700000000,
+                    nonce=nonce,
+                )
+                for nonce in range(1, 4)
+            ]
+        )
+
+    results = asyncio.run(place_orders())
+
+    assert mock_place_trigger_order_response.call_count == 3
+    assert [res.req["place_order"]["order"]["nonce"] for res in results] == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert all(res.status == "success" for res in results)
+
+
+def test_async_place_twap_order_positional_args(
+    mock_place_trigger_order_response: MagicMock,
+    url: str,
+    chain_id: int,
+    endpoint_addr: str,
+    private_keys: list[str],
+    senders: list[str],
+):
+    client = AsyncTriggerExecuteClient(
+        TriggerClientOpts(
+            url=url,
+            chain_id=chain_id,
+            endpoint_addr=endpoint_addr,
+            signer=private_keys[0],
+        )
+    )
+
+    res = asyncio.run(
+        client.aplace_twap_order(
+            1,
+            "50000000000000000000000",
+            "1000000000000000000",
+            5,
+            0.01,
+            300,
+            sender=senders[0],
+            expiration=1700000000,
+            nonce=7,
+        )
+    )
+
+    assert mock_place_trigger_order_response.call_count == 1
+    assert res.req["place_order"]["order"]["nonce"] == "7"
+    assert res.req["place_order"]["trigger"]["time_trigger"]["interval"] == 300
@@ -3,6 +3,8 @@ from nado_protocol.trigger_client import TriggerClient, TriggerClientOpts
 from eth_account.signers.local import LocalAccount
 from pydantic import ValidationError
 import pytest
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 
 def test_create_client_url_validation():
@@ -94,3 +96,34 @@ def test_create_client_all_opts(
         == client_from_opts.endpoint_addr
         == endpoint_addr
     )
+
+
+def test_create_client_connection_pool(url: str):
+    trigger_client = TriggerClient({"url": url})
+    adapter = trigger_client.session.get_adapter(f"{url}/execute")
+    assert adapter._pool_maxsize == 32
+
+    trigger_client = TriggerClient(TriggerClientOpts(url=url, pool_maxsize=4))
+    adapter = trigger_client.session.get_adapter(f"{url}/execute")
+    assert adapter._pool_maxsize == 4
+
+
+def test_create_client_shared_session(url: str):
+    session = requests.Session()
+    trigger_client = TriggerClient({"url": url}, session=session)
+    assert trigger_client.session is session
+    adapter = session.get_adapter(f"{url}/execute")
+    assert adapter._pool_maxsize == DEFAULT_POOLSIZE
+
+
+def test_create_client_keeps_injected_adapters(url: str):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=4, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    trigger_client = TriggerClient({"url": url}, session=session)
+
+    assert trigger_client.session is session
+    assert session.get_adapter(f"{url}/execute") is adapter
+    assert session.get_adapter("https://example.com/query") is adapter
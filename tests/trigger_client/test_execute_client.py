@@ -1,5 +1,9 @@
+import json
+from unittest.mock import MagicMock
 from eth_account import Account
 from nado_protocol.trigger_client import TriggerClient
+from nado_protocol.utils.exceptions import ExecuteFailedException
+from pydantic import ValidationError
 import pytest
 
 
@@ -50,3 +54,106 @@ def test_execute_client_properties(
     trigger_client.linked_signer = None
 
     assert trigger_client.linked_signer == trigger_client.signer
+
+
+def test_execute_request_dict(
+    mock_place_trigger_order_response: MagicMock,
+    url: str,
+    senders: list[str],
+    order_params: dict,
+):
+    req = {
+        "place_order": {
+            "product_id": 1,
+            "order": {
+                **{k: str(v) for k, v in order_params.items() if k != "sender"},
+                "sender": senders[0].lower(),
+            },
+            "signature": "0x123",
+            "trigger": {
+                "price_trigger": {
+                    "price_requirement": {"last_price_below": "9900000000000000000000"}
+                }
+            },
+        }
+    }
+
+    trigger_client = TriggerClient({"url": url})
+    res = trigger_client.execute(req)
+    assert res.req == req
+    assert mock_place_trigger_order_response.call_args.kwargs["json"] == req
+
+    with pytest.raises(ValidationError):
+        trigger_client.execute({"place_order": {"product_id": 1}})
+
+    trusted_client = TriggerClient({"url": url, "trust_input": True})
+    trusted_req = {"place_order": {"product_id": 1}}
+    res = trusted_client.execute(trusted_req)
+    assert res.req == trusted_req
+    assert mock_place_trigger_order_response.call_args.kwargs["json"] == trusted_req
+
+
+def test_execute_lightweight_response(mock_post: MagicMock, url: str):
+    req = {"place_order": {"product_id": 1}}
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    # Key order and formatting of the body do not matter
+    mock_response.json.return_value = {
+        "data": {"digest": "0x2"},
+        "signature": "0x1",
+        "status": "success",
+    }
+    mock_post.return_value = mock_response
+
+    trigger_client = TriggerClient(
+        {"url": url, "trust_input": True, "lightweight": True}
+    )
+    res = trigger_client.execute(req)
+    assert res.status == "success"
+    assert res.req == req
+    assert res.signature == "0x1"
+    assert res.data is None
+
+    json_response = {"status": "failure", "error": "Too Many Requests!"}
+    mock_response.json.return_value = json_response
+    mock_response.text = json.dumps(json_response)
+    with pytest.raises(ExecuteFailedException, match="Too Many Requests!"):
+        trigger_client.execute(req)
+
+
+def test_execute_many(
+    mock_place_trigger_order_response: MagicMock,
+    url: str,
+    senders: list[str],
+    order_params: dict,
+):
+    def place_order_req(nonce: int) -> dict:
+        return {
+            "place_order": {
+                "product_id": 1,
+                "order": {
+                    **{k: str(v) for k, v in order_params.items() if k != "sender"},
+                    "sender": senders[0].lower(),
+                    "nonce": str(nonce),
+                },
+                "signature": "0x123",
+                "trigger": {
+                    "price_trigger": {
+                        "price_requirement": {
+                            "last_price_below": "9900000000000000000000"
+                        }
+                    }
+                },
+            }
+        }
+
+    trigger_client = TriggerClient({"url": url})
+    assert trigger_client.execute_many([]) == []
+
+    reqs = [place_order_req(1), {"place_order": {"product_id": 1}}, place_order_req(3)]
+    results = trigger_client.execute_many(reqs)
+
+    assert mock_place_trigger_order_response.call_count == 2
+    assert results[0].req == reqs[0]
+    assert isinstance(results[1], ValidationError)
+    assert results[2].req == reqs[2]
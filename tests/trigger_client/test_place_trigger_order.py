@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 import json
 from eth_account import Account
 import pytest
+from pydantic import ValidationError
 from nado_protocol.contracts.eip712.sign import (
     build_eip712_typed_data,
     sign_eip712_typed_data,
@@ -13,6 +14,7 @@ from nado_protocol.trigger_client import TriggerClient
 from nado_protocol.trigger_client.types.execute import (
     PlaceTriggerOrderParams,
     PlaceTriggerOrderRequest,
+    PlaceTriggerOrdersParams,
     to_trigger_execute_request,
 )
 from nado_protocol.trigger_client.types.models import (
@@ -313,6 +315,10 @@ def test_place_order_execute_success(
     assert res.error is None
     assert res.data is None
 
+    # the caller's params are left untouched
+    assert place_trigger_order_params.signature is None
+    assert isinstance(place_trigger_order_params.order.sender, SubaccountParams)
+
     mock_response.status_code = 200
     json_response = {
         "status": "failure",
@@ -789,6 +795,37 @@ def test_place_twap_order_with_custom_amounts(
     assert trigger_type == OrderAppendixTriggerType.TWAP_CUSTOM_AMOUNTS
 
 
+def test_place_twap_order_with_int_custom_amounts(
+    trigger_client: TriggerClient, mock_post: MagicMock
+):
+    """Test int custom amounts are posted as strings."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "signature": "test_signature",
+    }
+    mock_post.return_value = mock_response
+
+    trigger_client.place_twap_order(
+        product_id=2,
+        price_x18=25000000000000000000000,
+        total_amount_x18=10 * 10**18,
+        times=2,
+        slippage_frac=0.005,
+        interval_seconds=600,
+        custom_amounts_x18=[4 * 10**18, 6 * 10**18],
+        expiration=1700000000,
+        nonce=789012,
+    )
+
+    posted = mock_post.call_args.kwargs["json"]
+    assert posted["place_order"]["trigger"]["time_trigger"]["amounts"] == [
+        "4000000000000000000",
+        "6000000000000000000",
+    ]
+
+
 def test_place_twap_order_with_reduce_only(
     trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
 ):
@@ -912,6 +949,11 @@ def test_place_price_trigger_order_all_trigger_types(
             trigger_type.replace("_price_", "_price_")
             in trigger["price_trigger"]["price_requirement"]
         )
+        assert trigger == {
+            "price_trigger": {
+                "price_requirement": {trigger_type: "49000000000000000000000"}
+            }
+        }
 
 
 def test_place_price_trigger_order_with_reduce_only(
@@ -993,6 +1035,44 @@ def test_place_price_trigger_order_invalid_trigger_type(
         )
 
 
+def test_place_price_trigger_order_validates_dependency(
+    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+):
+    """Test a dict dependency is validated before the order is posted."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "signature": "test_signature",
+    }
+    mock_post.return_value = mock_response
+
+    order_kwargs = dict(
+        product_id=1,
+        sender=senders[0],
+        price_x18="50000000000000000000000",
+        amount_x18="1000000000000000000",
+        expiration=1700000000,
+        nonce=123456,
+        trigger_price_x18="51000000000000000000000",
+        trigger_type="last_price_above",
+    )
+
+    res = trigger_client.place_price_trigger_order(
+        **order_kwargs,
+        dependency={"digest": "0x" + "ab" * 32, "on_partial_fill": "true"},
+    )
+    assert res.req["place_order"]["trigger"]["price_trigger"]["dependency"] == {
+        "digest": "0x" + "ab" * 32,
+        "on_partial_fill": True,
+    }
+
+    with pytest.raises(ValidationError):
+        trigger_client.place_price_trigger_order(
+            **order_kwargs, dependency={"digest": "0x" + "ab" * 32}
+        )
+
+
 def test_place_twap_order_validation_errors(
     trigger_client: TriggerClient, senders: list[str]
 ):
@@ -1182,3 +1262,52 @@ def test_place_price_trigger_order_appendix_validation(
 
     assert order_trigger_type(appendix) == OrderAppendixTriggerType.PRICE
     assert order_execution_type(appendix) == OrderType.POST_ONLY
+
+
+def test_place_trigger_orders_single_request(
+    trigger_client: TriggerClient, mock_post: MagicMock, senders: list[str]
+):
+    """Test that multiple trigger orders are signed individually and sent in one request."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "data": {"place_orders": [{"digest": "0x1"}, {"digest": "0x2"}]},
+    }
+    mock_post.return_value = mock_response
+
+    orders = [
+        PlaceTriggerOrderParams(
+            product_id=product_id,
+            order=OrderParams(
+                sender=senders[0],
+                priceX18=1000,
+                amount=amount,
+                expiration=1000,
+                nonce=nonce,
+                appendix=build_appendix(
+                    OrderType.DEFAULT, trigger_type=OrderAppendixTriggerType.PRICE
+                ),
+            ),
+            trigger=PriceTrigger(
+                price_trigger=PriceTriggerData(
+                    price_requirement=LastPriceAbove(last_price_above=100)
+                )
+            ),
+        )
+        for product_id, amount, nonce in [(1, 1000, 1), (2, -1000, 2)]
+    ]
+
+    res = trigger_client.place_trigger_orders(PlaceTriggerOrdersParams(orders=orders))
+
+    assert mock_post.call_count == 1
+    assert res.data.place_orders[1].digest == "0x2"
+    placed = res.req["place_orders"]["orders"]
+    assert [o["product_id"] for o in placed] == [1, 2]
+    for order_params, sent in zip(orders, placed):
+        order = order_params.order.copy()
+        order.sender = hex_to_bytes32(senders[0])
+        assert sent["signature"] == trigger_client._sign(
+            NadoExecuteType.PLACE_ORDER, order.dict(), order_params.product_id
+        )
+        assert sent["order"]["nonce"] == str(order_params.order.nonce)
@@ -0,0 +1,28 @@
+import pytest
+from nado_protocol.utils.bytes32 import subaccount_to_bytes32, subaccount_to_hex
+from nado_protocol.utils.subaccount import SubaccountParams
+
+
+OWNER = "0x1234567890abcdef1234567890abcdef12345678"
+
+
+def test_subaccount_to_bytes32_owner_and_name():
+    """Test owner + name encoding is identical across input forms."""
+    expected = bytes.fromhex(OWNER[2:]) + b"default" + bytes(5)
+
+    assert subaccount_to_bytes32(OWNER, "default") == expected
+    assert (
+        subaccount_to_bytes32(
+            SubaccountParams(subaccount_owner=OWNER, subaccount_name="default")
+        )
+        == expected
+    )
+    # Repeated lookups are served from the cache and stay consistent
+    assert subaccount_to_bytes32(OWNER, "default") == expected
+    assert subaccount_to_hex(OWNER, "default") == f"0x{expected.hex()}"
+
+
+def test_subaccount_to_bytes32_missing_owner():
+    """Test SubaccountParams without an owner is rejected."""
+    with pytest.raises(ValueError, match="Missing `subaccount_owner`"):
+        subaccount_to_bytes32(SubaccountParams(subaccount_name="default"))
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+import pytest
+from nado_protocol.indexer_client.types.query import IndexerAccountSnapshotsData
+from nado_protocol.utils.margin_manager import MarginManager
+
+TIMESTAMP = 1700000000
+
+
+def _subaccount(i: int) -> str:
+    return "0x" + f"{i:02x}" * 32
+
+
+def _snapshots_client(responses: dict[str, dict[str, list]]) -> MagicMock:
+    """Client whose indexer answers multi-subaccount snapshot requests from `responses`."""
+    client = MagicMock()
+
+    def get_multi_subaccount_snapshots(params):
+        return IndexerAccountSnapshotsData.construct(
+            snapshots={
+                key: snapshots
+                for key, snapshots in responses.items()
+                if key.lower()
+                in {subaccount.lower() for subaccount in params.subaccounts}
+            }
+        )
+
+    client.context.indexer_client.get_multi_subaccount_snapshots.side_effect = (
+        get_multi_subaccount_snapshots
+    )
+    return client
+
+
+def test_fetch_snapshot_events_batched_splits_into_chunks():
+    subaccounts = [_subaccount(i) for i in range(5)]
+    events = {subaccount: [MagicMock()] for subaccount in subaccounts}
+    client = _snapshots_client(
+        {subaccount: {str(TIMESTAMP): events[subaccount]} for subaccount in subaccounts}
+    )
+
+    res = MarginManager.fetch_snapshot_events_batched(
+        client, subaccounts, TIMESTAMP, batch_size=2
+    )
+
+    get_snapshots = client.context.indexer_client.get_multi_subaccount_snapshots
+    assert get_snapshots.call_count == 3
+    assert sorted(
+        len(call.args[0].subaccounts) for call in get_snapshots.call_args_list
+    ) == [1, 2, 2]
+    assert all(
+        call.args[0].timestamps == [TIMESTAMP] for call in get_snapshots.call_args_list
+    )
+    assert res == events
+
+
+def test_fetch_snapshot_events_batched_merges_mixed_case_keys():
+    lower = "0x" + "ab" * 32
+    upper = "0x" + "CD" * 32
+    lower_events, upper_events = [MagicMock()], [MagicMock()]
+    client = _snapshots_client(
+        {
+            lower.upper().replace("0X", "0x"): {str(TIMESTAMP): lower_events},
+            upper.lower(): {str(TIMESTAMP): upper_events},
+        }
+    )
+
+    res = MarginManager.fetch_snapshot_events_batched(client, [lower, upper], TIMESTAMP)
+
+    assert res == {lower: lower_events, upper: upper_events}
+
+
+def test_fetch_snapshot_events_batched_missing_subaccount():
+    present, missing = _subaccount(1), _subaccount(2)
+    older, latest = [MagicMock()], [MagicMock()]
+    # The requested timestamp is absent, so the latest returned snapshot is used.
+    client = _snapshots_client(
+        {present: {str(TIMESTAMP - 60): older, str(TIMESTAMP - 30): latest}}
+    )
+
+    res = MarginManager.fetch_snapshot_events_batched(
+        client, [present, missing], TIMESTAMP
+    )
+
+    assert res == {present: latest, missing: []}
+
+
+def test_fetch_snapshot_events_batched_empty_input():
+    client = _snapshots_client({})
+
+    assert MarginManager.fetch_snapshot_events_batched(client, [], TIMESTAMP) == {}
+    client.context.indexer_client.get_multi_subaccount_snapshots.assert_not_called()
+
+
+def test_fetch_snapshot_events_batched_invalid_batch_size():
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        MarginManager.fetch_snapshot_events_batched(
+            _snapshots_client({}), [_subaccount(1)], TIMESTAMP, batch_size=0
+        )
@@ -1,7 +1,28 @@
-from nado_protocol.utils.math import to_x18
+from decimal import Decimal
+from nado_protocol.utils.math import from_x18_decimal, to_pow_10, to_x6, to_x18
 
 
 def test_to_x18():
     assert to_x18(10.15) == 10150000000000000000
     assert to_x18(10) == 10000000000000000000
     assert to_x18(2000.150) == 2000150000000000000000
+    assert to_x18(-3) == -3000000000000000000
+
+
+def test_to_x6():
+    assert to_x6(10.15) == 10150000
+    assert to_x6(7) == 7000000
+
+
+def test_to_pow_10():
+    assert to_pow_10(15, 17) == 1500000000000000000
+    assert to_pow_10(2, 0) == 2
+    assert to_pow_10(1, 80) == 10**80
+
+
+def test_from_x18_decimal():
+    assert from_x18_decimal(10150000000000000000) == Decimal("10.15")
+    assert from_x18_decimal("-3000000000000000000") == Decimal(-3)
+    assert from_x18_decimal("123456789012345678901") == Decimal(
+        "123.456789012345678901"
+    )
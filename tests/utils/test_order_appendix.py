@@ -328,6 +328,30 @@ def test_reserved_bits_extraction():
     assert reserved == 0
 
 
+def test_build_appendix_is_memoized():
+    """Test that repeated calls with the same parameters reuse the cached appendix."""
+    build_appendix.cache_clear()
+    kwargs = dict(
+        order_type=OrderType.IOC,
+        trigger_type=OrderAppendixTriggerType.TWAP,
+        twap_times=10,
+        twap_slippage_frac=0.005,
+    )
+    first = build_appendix(**kwargs)
+    second = build_appendix(**kwargs)
+
+    assert first == second
+    assert build_appendix.cache_info().hits == 1
+    assert order_twap_data(first) == (10, 0.005)
+
+    # Invalid combinations are never cached and keep raising
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            build_appendix(
+                OrderType.DEFAULT, trigger_type=OrderAppendixTriggerType.TWAP
+            )
+
+
 def test_isolated_margin_without_isolated_flag():
     """Test that providing isolated_margin without isolated=True raises error."""
     with pytest.raises(
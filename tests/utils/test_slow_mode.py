@@ -37,6 +37,9 @@ def test_encode_claim_builder_fee_tx_with_real_sender():
 
     # Verify tx type
     assert tx[0] == 31
+    # Verify ABI layout: sender word followed by the left-padded builder id word
+    assert tx[1:33] == sender
+    assert tx[33:] == bytes(31) + bytes([42])
 
 
 def test_encode_claim_builder_fee_tx_invalid_sender_length():
@@ -58,3 +61,12 @@ def test_encode_claim_builder_fee_tx_max_builder_id():
 
     tx = encode_claim_builder_fee_tx(sender, max_builder_id)
     assert tx[0] == 31
+
+
+def test_encode_claim_builder_fee_tx_invalid_builder_id():
+    """Test that builder IDs outside the uint32 range raise error."""
+    with pytest.raises(ValueError, match="builder_id must be a uint32"):
+        encode_claim_builder_fee_tx(bytes(32), 1 << 32)
+
+    with pytest.raises(ValueError, match="builder_id must be a uint32"):
+        encode_claim_builder_fee_tx(bytes(32), -1)
@@ -4,6 +4,7 @@ from nado_protocol.utils.twap import (
     validate_twap_order,
     estimate_twap_completion_time,
     calculate_equal_amounts,
+    equal_amount_per_execution,
 )
 from nado_protocol.utils.order import (
     OrderAppendixTriggerType,
@@ -53,6 +54,34 @@ def test_create_basic_twap_order(senders):
     assert abs(slippage - 0.01) < 1e-6
 
 
+def test_create_twap_order_int_amounts(senders):
+    """Test int x18 inputs build the same order as their string forms."""
+    kwargs = dict(
+        product_id=1,
+        sender=senders[0],
+        expiration=1700000000,
+        nonce=123456,
+        times=5,
+        slippage_frac=0.01,
+        interval_seconds=300,
+    )
+    from_ints = create_twap_order(
+        price_x18=50000000000000000000000,
+        total_amount_x18=-1000000000000000000,
+        **kwargs,
+    )
+    from_strs = create_twap_order(
+        price_x18="50000000000000000000000",
+        total_amount_x18="-1000000000000000000",
+        **kwargs,
+    )
+
+    assert from_ints.order == from_strs.order
+    assert from_ints.order.priceX18 == 50000000000000000000000
+    assert from_ints.order.amount == -1000000000000000000
+    assert equal_amount_per_execution(-1500, 3) == (-500, 0)
+
+
 def test_create_custom_amounts_twap_order():
     """Test creating a TWAP order with custom amounts."""
     custom_amounts_x18 = ["400", "300", "200", "100"]
@@ -128,6 +157,13 @@ def test_calculate_equal_amounts():
         calculate_equal_amounts("1001", 5)
 
 
+def test_equal_amount_per_execution():
+    """Test splitting a total amount evenly across executions."""
+    assert equal_amount_per_execution("1000", 5) == (200, 0)
+    assert equal_amount_per_execution("-1500", 3) == (-500, 0)
+    assert equal_amount_per_execution("1001", 5) == (200, 1)
+
+
 def test_twap_order_validation_errors(senders):
     """Test TWAP order creation validation errors."""
     base_params = {